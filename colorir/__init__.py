@@ -1,10 +1,82 @@
-from .color_class import *
-from .palette import *
-from .gradient import *
-from .color_format import *
-from .utils import *
-from . import config
+import importlib
 
 __version__ = '2.0.4'
 
+# Public names are only imported from their submodules when first accessed (PEP 562), so that
+# importing colorir does not load machinery that is not going to be used
+_lazy_names = {
+    "color_class": [
+        "ColorLike",
+        "ColorBase",
+        "ColorTupleBase",
+        "ColorPolarBase",
+        "RGB",
+        "sRGB",
+        "HSV",
+        "HSL",
+        "CMY",
+        "CMYK",
+        "CIELuv",
+        "CIELab",
+        "HCLuv",
+        "HCLab",
+        "Hex"
+    ],
+    "palette": [
+        "Palette",
+        "StackPalette",
+        "find_palettes",
+        "delete_palette"
+    ],
+    "gradient": [
+        "Grad",
+        "PolarGrad",
+        "RGBGrad",
+        "RGBLinearGrad"
+    ],
+    "color_format": [
+        "ColorFormat",
+        "FormatError",
+        "PYGAME_COLOR_FORMAT",
+        "TKINTER_COLOR_FORMAT",
+        "KIVY_COLOR_FORMAT",
+        "WEB_COLOR_FORMAT",
+        "MATPLOTLIB_COLOR_FORMAT"
+    ],
+    "color_array": [
+        "ColorArray"
+    ],
+    "utils": [
+        "swatch",
+        "show",
+        "simplified_dist",
+        "simplified_dist_batch",
+        "color_dist",
+        "random_color",
+        "random_colors",
+        "color_str",
+        "hue_sort_key",
+        "hue_sorted",
+        "grayscale",
+        "inverse",
+        "blend"
+    ]
+}
+_name_to_module = {name: module for module, names in _lazy_names.items() for name in names}
+_submodules = [*_lazy_names, "config"]
 
+__all__ = [*_name_to_module, *_submodules]
+
+
+def __getattr__(name):
+    if name in _submodules:
+        return importlib.import_module("." + name, __name__)
+    if name in _name_to_module:
+        value = getattr(importlib.import_module("." + _name_to_module[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
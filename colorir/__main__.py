@@ -2,7 +2,15 @@ import argparse
 from os import path
 from runpy import run_module
 from . import config
-config.DEFAULT_PALETTES_DIR = path.join(path.dirname(__file__), "examples/ex_palettes")
+_examples_dir = path.join(path.dirname(__file__), "examples")
+config.DEFAULT_PALETTES_DIR = path.join(_examples_dir, "ex_palettes")
+
+
+def _example_name(name):
+    # Check only the requested file instead of listing the examples directory as argparse 'choices'
+    if not path.isfile(path.join(_examples_dir, name + ".py")):
+        raise argparse.ArgumentTypeError(f"no example application named '{name}'")
+    return name
 
 
 def main(example):
@@ -13,6 +21,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(prog="python -m colorir",
                                      description="Execute example applications.")
     parser.add_argument("app",
+                        type=_example_name,
                         help="which example application to execute (e.g.: simple_turtle_2)")
     args = parser.parse_args()
     main(args.app)
@@ -0,0 +1,161 @@
+"""Conversions between sRGB and the CIE color spaces.
+
+These are the same formulas and constants used by :mod:`colorir.colormath` for the D65 illuminant
+and the 2° standard observer, which are the only ones used by colorir. Computing them directly
+avoids building an intermediate colormath object for every step of the conversion.
+
+sRGB values are in the range 0-1 and hues are in degrees.
+"""
+import functools
+import math
+
+CIE_E = 216.0 / 24389.0
+CIE_K = 24389.0 / 27.0
+# D65 reference white
+REF_X, REF_Y, REF_Z = 0.95047, 1.00000, 1.08883
+REF_U = (4.0 * REF_X) / (REF_X + (15.0 * REF_Y) + (3.0 * REF_Z))
+REF_V = (9.0 * REF_Y) / (REF_X + (15.0 * REF_Y) + (3.0 * REF_Z))
+
+RGB_TO_XYZ = ((0.412424, 0.357579, 0.180464),
+              (0.212656, 0.715158, 0.0721856),
+              (0.0193324, 0.119193, 0.950444))
+XYZ_TO_RGB = ((3.24071, -1.53726, -0.498571),
+              (-0.969258, 1.87599, 0.0415557),
+              (0.0556352, -0.203996, 1.05707))
+
+
+def _to_linear(v):
+    if v <= 0.04045:
+        return v / 12.92
+    return math.pow((v + 0.055) / 1.055, 2.4)
+
+
+# Linear value of each of the 256 possible 8-bit sRGB values
+SRGB8_TO_LINEAR = tuple(_to_linear(i / 255.0) for i in range(256))
+
+
+def _from_linear(v):
+    if v <= 0.0031308:
+        v = v * 12.92
+    else:
+        v = 1.055 * math.pow(v, 1 / 2.4) - 0.055
+    # Clamps the value to the sRGB gamut
+    return min(max(v, 0.0), 1.0)
+
+
+def _apply_matrix(matrix, v1, v2, v3):
+    # Negative results are clamped, as in colormath
+    return tuple(max(m1 * v1 + m2 * v2 + m3 * v3, 0.0) for m1, m2, m3 in matrix)
+
+
+def _srgb_to_xyz(r, g, b):
+    return _apply_matrix(RGB_TO_XYZ, _to_linear(r), _to_linear(g), _to_linear(b))
+
+
+def _xyz_to_srgb(x, y, z):
+    r, g, b = _apply_matrix(XYZ_TO_RGB, x, y, z)
+    return _from_linear(r), _from_linear(g), _from_linear(b)
+
+
+try:
+    _cbrt = math.cbrt
+except AttributeError:  # Python < 3.11
+    def _cbrt(v):
+        return math.pow(v, 1.0 / 3.0)
+
+
+def _lab_f(t):
+    if t > CIE_E:
+        # A cube root is both faster and more accurate than raising to the power of 1/3
+        return _cbrt(t)
+    return (7.787 * t) + (16.0 / 116.0)
+
+
+def _lab_f_inv(f):
+    t = f * f * f
+    if t > CIE_E:
+        return t
+    return (f - 16.0 / 116.0) / 7.787
+
+
+def _xyz_to_lab(x, y, z):
+    fx, fy, fz = _lab_f(x / REF_X), _lab_f(y / REF_Y), _lab_f(z / REF_Z)
+    return (116.0 * fy) - 16.0, 500.0 * (fx - fy), 200.0 * (fy - fz)
+
+
+def srgb_to_lab(r, g, b):
+    """Converts sRGB to CIELab."""
+    return _xyz_to_lab(*_srgb_to_xyz(r, g, b))
+
+
+def lab_to_srgb(l, a, b):
+    """Converts CIELab to sRGB, clamping the result to the sRGB gamut."""
+    fy = (l + 16.0) / 116.0
+    fx = a / 500.0 + fy
+    fz = fy - b / 200.0
+    return _xyz_to_srgb(REF_X * _lab_f_inv(fx), REF_Y * _lab_f_inv(fy), REF_Z * _lab_f_inv(fz))
+
+
+def srgb_to_luv(r, g, b):
+    """Converts sRGB to CIELuv."""
+    return _xyz_to_luv(*_srgb_to_xyz(r, g, b))
+
+
+def _xyz_to_luv(x, y, z):
+    denom = x + (15.0 * y) + (3.0 * z)
+    if denom == 0.0:
+        u = v = 0.0
+    else:
+        u = (4.0 * x) / denom
+        v = (9.0 * y) / denom
+    l = (116.0 * _lab_f(y / REF_Y)) - 16.0
+    return l, 13.0 * l * (u - REF_U), 13.0 * l * (v - REF_V)
+
+
+def luv_to_srgb(l, u, v):
+    """Converts CIELuv to sRGB, clamping the result to the sRGB gamut."""
+    # Without light there is no color, this also avoids dividing by zero below
+    if l <= 0.0:
+        return _xyz_to_srgb(0.0, 0.0, 0.0)
+    var_u = u / (13.0 * l) + REF_U
+    var_v = v / (13.0 * l) + REF_V
+    if l > CIE_K * CIE_E:
+        y = (l + 16.0) / 116.0
+        y = y * y * y
+    else:
+        y = l / CIE_K
+    x = y * 9.0 * var_u / (4.0 * var_v)
+    z = y * (12.0 - 3.0 * var_u - 20.0 * var_v) / (4.0 * var_v)
+    return _xyz_to_srgb(x, y, z)
+
+
+# Colors only have 256 ** 3 possible 8-bit RGB values and the same ones tend to be converted over
+# and over (e.g. when sampling a gradient), so the conversions from these values are memoized
+@functools.lru_cache(maxsize=4096)
+def srgb8_to_lab(r, g, b):
+    """Converts 8-bit sRGB integers (range 0-255) to CIELab."""
+    return _xyz_to_lab(*_apply_matrix(RGB_TO_XYZ, SRGB8_TO_LINEAR[r], SRGB8_TO_LINEAR[g],
+                                      SRGB8_TO_LINEAR[b]))
+
+
+@functools.lru_cache(maxsize=4096)
+def srgb8_to_luv(r, g, b):
+    """Converts 8-bit sRGB integers (range 0-255) to CIELuv."""
+    return _xyz_to_luv(*_apply_matrix(RGB_TO_XYZ, SRGB8_TO_LINEAR[r], SRGB8_TO_LINEAR[g],
+                                      SRGB8_TO_LINEAR[b]))
+
+
+def lab_to_lch(l, a, b):
+    """Converts CIELab (or CIELuv) to its cylindrical representation (LCHab or LCHuv)."""
+    c = math.sqrt(math.pow(a, 2) + math.pow(b, 2))
+    h = math.atan2(b, a)
+    if h > 0:
+        h = (h / math.pi) * 180
+    else:
+        h = 360 - (math.fabs(h) / math.pi) * 180
+    return l, c, h
+
+
+def lch_to_lab(l, c, h):
+    """Converts LCHab (or LCHuv) to its cartesian representation (CIELab or CIELuv)."""
+    return l, math.cos(math.radians(h)) * c, math.sin(math.radians(h)) * c
@@ -0,0 +1,219 @@
+"""Kernels for converting many sRGB colors to the CIE color spaces at once.
+
+The kernels perform the same operations as the scalar functions of :mod:`colorir._cie` (e.g. sRGB ->
+linear RGB -> XYZ -> CIELab) in a single pass over the colors. They are compiled with
+`numba <https://numba.pydata.org/>`_ when it is installed, in which case their results are identical
+to those of the scalar functions. Otherwise, a NumPy implementation is used instead, whose results
+may differ in the last few bits. Numba is only imported the first time a kernel is needed so that it
+does not slow down importing colorir.
+"""
+import numpy as np
+
+from ._cie import CIE_E, CIE_K, REF_X, REF_Y, REF_Z, REF_U, REF_V, RGB_TO_XYZ, XYZ_TO_RGB
+
+_kernels = None
+
+
+def srgb_to_lab(rgb) -> np.ndarray:
+    """Converts an array of shape (N, 3) with sRGB values in the range 0-1 to CIELab."""
+    rgb = np.ascontiguousarray(rgb, dtype=np.float64)
+    out = np.empty(rgb.shape, dtype=np.float64)
+    _get_kernels()["lab"](rgb, out)
+    return out
+
+
+def srgb_to_luv(rgb) -> np.ndarray:
+    """Converts an array of shape (N, 3) with sRGB values in the range 0-1 to CIELuv."""
+    rgb = np.ascontiguousarray(rgb, dtype=np.float64)
+    out = np.empty(rgb.shape, dtype=np.float64)
+    _get_kernels()["luv"](rgb, out)
+    return out
+
+
+def lab_to_srgb(lab) -> np.ndarray:
+    """Converts an array of shape (N, 3) with CIELab values to sRGB in the range 0-1, clamping the
+    result to the sRGB gamut."""
+    lab = np.ascontiguousarray(lab, dtype=np.float64)
+    out = np.empty(lab.shape, dtype=np.float64)
+    _get_kernels()["lab_inv"](lab, out)
+    return out
+
+
+def luv_to_srgb(luv) -> np.ndarray:
+    """Converts an array of shape (N, 3) with CIELuv values to sRGB in the range 0-1, clamping the
+    result to the sRGB gamut."""
+    luv = np.ascontiguousarray(luv, dtype=np.float64)
+    out = np.empty(luv.shape, dtype=np.float64)
+    _get_kernels()["luv_inv"](luv, out)
+    return out
+
+
+def _get_kernels():
+    global _kernels
+    if _kernels is None:
+        try:
+            _kernels = _compile_kernels()
+        except ImportError:
+            _kernels = {"lab": _srgb_to_lab_np, "luv": _srgb_to_luv_np, "lab_inv": _lab_to_srgb_np,
+                        "luv_inv": _luv_to_srgb_np}
+    return _kernels
+
+
+def _srgb_to_xyz_np(rgb):
+    lin = np.where(rgb <= 0.04045, rgb / 12.92, np.power((rgb + 0.055) / 1.055, 2.4))
+    r, g, b = lin[:, 0], lin[:, 1], lin[:, 2]
+    # Negative results are clamped, as in colormath
+    return [np.maximum(m1 * r + m2 * g + m3 * b, 0.0) for m1, m2, m3 in RGB_TO_XYZ]
+
+
+def _lab_f_np(t):
+    return np.where(t > CIE_E, np.cbrt(t), (7.787 * t) + (16.0 / 116.0))
+
+
+def _srgb_to_lab_np(rgb, out):
+    x, y, z = _srgb_to_xyz_np(rgb)
+    fx, fy, fz = _lab_f_np(x / REF_X), _lab_f_np(y / REF_Y), _lab_f_np(z / REF_Z)
+    out[:, 0] = (116.0 * fy) - 16.0
+    out[:, 1] = 500.0 * (fx - fy)
+    out[:, 2] = 200.0 * (fy - fz)
+
+
+def _srgb_to_luv_np(rgb, out):
+    x, y, z = _srgb_to_xyz_np(rgb)
+    denom = x + (15.0 * y) + (3.0 * z)
+    # Avoids dividing by zero for black
+    safe_denom = np.where(denom == 0.0, 1.0, denom)
+    u = np.where(denom == 0.0, 0.0, (4.0 * x) / safe_denom)
+    v = np.where(denom == 0.0, 0.0, (9.0 * y) / safe_denom)
+    l = (116.0 * _lab_f_np(y / REF_Y)) - 16.0
+    out[:, 0] = l
+    out[:, 1] = 13.0 * l * (u - REF_U)
+    out[:, 2] = 13.0 * l * (v - REF_V)
+
+
+def _lab_f_inv_np(f):
+    t = f * f * f
+    return np.where(t > CIE_E, t, (f - 16.0 / 116.0) / 7.787)
+
+
+def _xyz_to_srgb_np(x, y, z, out):
+    for i, (m1, m2, m3) in enumerate(XYZ_TO_RGB):
+        lin = np.maximum(m1 * x + m2 * y + m3 * z, 0.0)
+        srgb = np.where(lin <= 0.0031308, lin * 12.92, 1.055 * np.power(lin, 1 / 2.4) - 0.055)
+        # Clamps the values to the sRGB gamut
+        out[:, i] = np.clip(srgb, 0.0, 1.0)
+
+
+def _lab_to_srgb_np(lab, out):
+    fy = (lab[:, 0] + 16.0) / 116.0
+    fx = lab[:, 1] / 500.0 + fy
+    fz = fy - lab[:, 2] / 200.0
+    _xyz_to_srgb_np(REF_X * _lab_f_inv_np(fx), REF_Y * _lab_f_inv_np(fy), REF_Z * _lab_f_inv_np(fz), out)
+
+
+def _luv_to_srgb_np(luv, out):
+    l, u, v = luv[:, 0], luv[:, 1], luv[:, 2]
+    # Without light there is no color, this also avoids dividing by zero below
+    dark = l <= 0.0
+    safe_l = np.where(dark, 1.0, l)
+    var_u = u / (13.0 * safe_l) + REF_U
+    var_v = v / (13.0 * safe_l) + REF_V
+    fy = (safe_l + 16.0) / 116.0
+    y = np.where(safe_l > CIE_K * CIE_E, fy * fy * fy, safe_l / CIE_K)
+    x = y * 9.0 * var_u / (4.0 * var_v)
+    z = y * (12.0 - 3.0 * var_u - 20.0 * var_v) / (4.0 * var_v)
+    _xyz_to_srgb_np(np.where(dark, 0.0, x), np.where(dark, 0.0, y), np.where(dark, 0.0, z), out)
+
+
+def _compile_kernels():
+    from numba import njit, prange
+
+    (m11, m12, m13), (m21, m22, m23), (m31, m32, m33) = RGB_TO_XYZ
+
+    # fastmath is not used since it would make the results differ from those of the scalar functions
+    @njit(cache=True)
+    def to_xyz(r, g, b):
+        r = r / 12.92 if r <= 0.04045 else ((r + 0.055) / 1.055) ** 2.4
+        g = g / 12.92 if g <= 0.04045 else ((g + 0.055) / 1.055) ** 2.4
+        b = b / 12.92 if b <= 0.04045 else ((b + 0.055) / 1.055) ** 2.4
+        return (max(m11 * r + m12 * g + m13 * b, 0.0),
+                max(m21 * r + m22 * g + m23 * b, 0.0),
+                max(m31 * r + m32 * g + m33 * b, 0.0))
+
+    @njit(cache=True)
+    def lab_f(t):
+        if t > CIE_E:
+            return np.cbrt(t)
+        return (7.787 * t) + (16.0 / 116.0)
+
+    (n11, n12, n13), (n21, n22, n23), (n31, n32, n33) = XYZ_TO_RGB
+
+    @njit(cache=True)
+    def from_linear(v):
+        v = max(v, 0.0)
+        v = v * 12.92 if v <= 0.0031308 else 1.055 * v ** (1 / 2.4) - 0.055
+        return min(max(v, 0.0), 1.0)
+
+    @njit(cache=True)
+    def lab_f_inv(f):
+        t = f * f * f
+        if t > CIE_E:
+            return t
+        return (f - 16.0 / 116.0) / 7.787
+
+    @njit(parallel=True, cache=True)
+    def lab_inv(lab, out):
+        for i in prange(lab.shape[0]):
+            fy = (lab[i, 0] + 16.0) / 116.0
+            fx = lab[i, 1] / 500.0 + fy
+            fz = fy - lab[i, 2] / 200.0
+            x, y, z = REF_X * lab_f_inv(fx), REF_Y * lab_f_inv(fy), REF_Z * lab_f_inv(fz)
+            out[i, 0] = from_linear(n11 * x + n12 * y + n13 * z)
+            out[i, 1] = from_linear(n21 * x + n22 * y + n23 * z)
+            out[i, 2] = from_linear(n31 * x + n32 * y + n33 * z)
+
+    @njit(parallel=True, cache=True)
+    def luv_inv(luv, out):
+        for i in prange(luv.shape[0]):
+            l = luv[i, 0]
+            if l <= 0.0:
+                x = y = z = 0.0
+            else:
+                var_u = luv[i, 1] / (13.0 * l) + REF_U
+                var_v = luv[i, 2] / (13.0 * l) + REF_V
+                if l > CIE_K * CIE_E:
+                    y = (l + 16.0) / 116.0
+                    y = y * y * y
+                else:
+                    y = l / CIE_K
+                x = y * 9.0 * var_u / (4.0 * var_v)
+                z = y * (12.0 - 3.0 * var_u - 20.0 * var_v) / (4.0 * var_v)
+            out[i, 0] = from_linear(n11 * x + n12 * y + n13 * z)
+            out[i, 1] = from_linear(n21 * x + n22 * y + n23 * z)
+            out[i, 2] = from_linear(n31 * x + n32 * y + n33 * z)
+
+    @njit(parallel=True, cache=True)
+    def lab(rgb, out):
+        for i in prange(rgb.shape[0]):
+            x, y, z = to_xyz(rgb[i, 0], rgb[i, 1], rgb[i, 2])
+            fx, fy, fz = lab_f(x / REF_X), lab_f(y / REF_Y), lab_f(z / REF_Z)
+            out[i, 0] = (116.0 * fy) - 16.0
+            out[i, 1] = 500.0 * (fx - fy)
+            out[i, 2] = 200.0 * (fy - fz)
+
+    @njit(parallel=True, cache=True)
+    def luv(rgb, out):
+        for i in prange(rgb.shape[0]):
+            x, y, z = to_xyz(rgb[i, 0], rgb[i, 1], rgb[i, 2])
+            denom = x + (15.0 * y) + (3.0 * z)
+            if denom == 0.0:
+                u = v = 0.0
+            else:
+                u = (4.0 * x) / denom
+                v = (9.0 * y) / denom
+            l = (116.0 * lab_f(y / REF_Y)) - 16.0
+            out[i, 0] = l
+            out[i, 1] = 13.0 * l * (u - REF_U)
+            out[i, 2] = 13.0 * l * (v - REF_V)
+
+    return {"lab": lab, "luv": luv, "lab_inv": lab_inv, "luv_inv": luv_inv}
@@ -0,0 +1,84 @@
+"""Vectorized versions of the conversion functions of the standard library's :mod:`colorsys` module.
+
+The functions take and return a separate NumPy array for each color component (structure of arrays
+layout) so that many colors can be converted at once. Results are the same as those of calling the
+corresponding :mod:`colorsys` function for each color.
+"""
+import numpy as np
+
+ONE_THIRD = 1.0 / 3.0
+ONE_SIXTH = 1.0 / 6.0
+TWO_THIRD = 2.0 / 3.0
+
+
+def _hue_array(r, g, b, maxc, rangec):
+    # Avoid dividing by zero for grays, whose hue is set to 0 anyway
+    rangec = np.where(rangec == 0, 1, rangec)
+    rc = (maxc - r) / rangec
+    gc = (maxc - g) / rangec
+    bc = (maxc - b) / rangec
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    return (h / 6.0) % 1.0
+
+
+def rgb_to_hls_array(r, g, b):
+    """Vectorized version of :func:`colorsys.rgb_to_hls`."""
+    r, g, b = (np.asarray(spec, dtype=float) for spec in (r, g, b))
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    sumc = maxc + minc
+    rangec = maxc - minc
+    l = sumc / 2.0
+    gray = rangec == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(l <= 0.5, rangec / sumc, rangec / (2.0 - maxc - minc))
+    s = np.where(gray, 0.0, s)
+    h = np.where(gray, 0.0, _hue_array(r, g, b, maxc, rangec))
+    return h, l, s
+
+
+def hls_to_rgb_array(h, l, s):
+    """Vectorized version of :func:`colorsys.hls_to_rgb`."""
+    h, l, s = (np.asarray(spec, dtype=float) for spec in (h, l, s))
+    m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))
+    m1 = 2.0 * l - m2
+    rgb = []
+    for hue in (h + ONE_THIRD, h, h - ONE_THIRD):
+        hue = hue % 1.0
+        rgb.append(np.select(
+            [hue < ONE_SIXTH, hue < 0.5, hue < TWO_THIRD],
+            [m1 + (m2 - m1) * hue * 6.0, m2, m1 + (m2 - m1) * (TWO_THIRD - hue) * 6.0],
+            m1
+        ))
+    gray = s == 0.0
+    return tuple(np.where(gray, l, spec) for spec in rgb)
+
+
+def rgb_to_hsv_array(r, g, b):
+    """Vectorized version of :func:`colorsys.rgb_to_hsv`."""
+    r, g, b = (np.asarray(spec, dtype=float) for spec in (r, g, b))
+    maxc = np.maximum(np.maximum(r, g), b)
+    minc = np.minimum(np.minimum(r, g), b)
+    rangec = maxc - minc
+    gray = rangec == 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = np.where(gray, 0.0, rangec / maxc)
+    h = np.where(gray, 0.0, _hue_array(r, g, b, maxc, rangec))
+    return h, s, maxc
+
+
+def hsv_to_rgb_array(h, s, v):
+    """Vectorized version of :func:`colorsys.hsv_to_rgb`."""
+    h, s, v = (np.asarray(spec, dtype=float) for spec in (h, s, v))
+    i = (h * 6.0).astype(int)
+    f = (h * 6.0) - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
+    conds = [i == 0, i == 1, i == 2, i == 3, i == 4]
+    r = np.select(conds, [v, q, p, p, t], v)
+    g = np.select(conds, [t, v, v, q, p], p)
+    b = np.select(conds, [p, p, t, v, v], q)
+    gray = s == 0.0
+    return np.where(gray, v, r), np.where(gray, v, g), np.where(gray, v, b)
@@ -0,0 +1,298 @@
+"""Compact storage for large collections of colors.
+
+A :class:`ColorArray` keeps the RGBA values of many colors in four contiguous NumPy arrays
+(structure of arrays) rather than as individual color objects. This is much lighter on memory and
+allows whole collections of colors to be processed at once with vectorized operations.
+
+Examples:
+    Store some colors and compute the distance between all of them:
+
+    >>> arr = ColorArray.from_colors(["#ff0000", "#00ff00", "#0000ff"])
+    >>> len(arr)
+    3
+    >>> from colorir import simplified_dist_batch
+    >>> simplified_dist_batch(arr, arr).shape
+    (3, 3)
+
+    Get the colors back as color objects:
+
+    >>> arr.to_colors()
+    [Hex('#ff0000'), Hex('#00ff00'), Hex('#0000ff')]
+"""
+from typing import Iterable, List
+
+import numpy as np
+
+from . import config
+from .color_class import ColorBase, ColorLike
+from .color_format import ColorFormat
+from ._colorsys import rgb_to_hls_array, rgb_to_hsv_array, hls_to_rgb_array, hsv_to_rgb_array
+from . import _cie_numba
+
+__all__ = [
+    "ColorArray"
+]
+
+
+class ColorArray:
+    """Collection of colors stored as separate arrays of 8-bit RGBA components.
+
+    Args:
+        n: Number of colors in the array. The values of the components are not initialized.
+
+    Attributes:
+        r: Array with the red component of the colors.
+        g: Array with the green component of the colors.
+        b: Array with the blue component of the colors.
+        a: Array with the alpha component of the colors.
+    """
+
+    def __init__(self, n: int = 0):
+        self.r = np.empty(n, dtype=np.uint8)
+        self.g = np.empty(n, dtype=np.uint8)
+        self.b = np.empty(n, dtype=np.uint8)
+        self.a = np.empty(n, dtype=np.uint8)
+
+    @classmethod
+    def from_rgba(cls, rgba) -> "ColorArray":
+        """Creates a :class:`ColorArray` from an array of shape (N, 3) or (N, 4) with RGB(A) values
+        in the range 0-255.
+
+        If the alpha column is omitted the colors will be fully opaque.
+        """
+        rgba = np.asarray(rgba)
+        if rgba.ndim != 2 or rgba.shape[1] not in (3, 4):
+            raise ValueError("'rgba' must be an array of shape (N, 3) or (N, 4)")
+        if rgba.dtype != np.uint8:
+            # Out of range values would otherwise wrap around when converted to 8-bit integers
+            if len(rgba) and (rgba.min() < 0 or rgba.max() > 255):
+                raise ValueError("the values of 'rgba' must be in the range 0-255")
+            rgba = np.rint(rgba)
+        obj = cls.__new__(cls)
+        obj.r, obj.g, obj.b = (np.ascontiguousarray(col, dtype=np.uint8) for col in rgba.T[:3])
+        if rgba.shape[1] == 4:
+            obj.a = np.ascontiguousarray(rgba[:, 3], dtype=np.uint8)
+        else:
+            obj.a = np.full(len(rgba), 255, dtype=np.uint8)
+        return obj
+
+    @classmethod
+    def from_colors(cls, colors: Iterable[ColorLike], color_format: ColorFormat = None) -> "ColorArray":
+        """Creates a :class:`ColorArray` from color-like objects.
+
+        Args:
+            colors: Colors that will be stored.
+            color_format: Color format used to interpret the colors that are not instances of
+                :class:`~colorir.color_class.ColorBase`. Defaults to :data:`config.DEFAULT_COLOR_FORMAT
+                <colorir.config.DEFAULT_COLOR_FORMAT>`.
+        """
+        if color_format is None:
+            color_format = config.DEFAULT_COLOR_FORMAT
+        rgba = [(color if isinstance(color, ColorBase) else color_format.format(color))._rgba
+                for color in colors]
+        return cls.from_rgba(np.array(rgba, dtype=np.uint8).reshape(-1, 4))
+
+    @classmethod
+    def from_hsl(cls, h, s, l, a=None, max_h=360, max_sla=1) -> "ColorArray":
+        """Creates a :class:`ColorArray` from arrays with the components of HSL colors.
+
+        All colors are converted at once, which is much faster than creating a
+        :class:`~colorir.color_class.HSL` object for each of them.
+
+        Examples:
+            >>> ColorArray.from_hsl([0, 120, 240], 1, 0.5).to_colors()
+            [Hex('#ff0000'), Hex('#00ff00'), Hex('#0000ff')]
+
+        Args:
+            h: Array with the hue of the colors.
+            s: Array with the saturation of the colors.
+            l: Array with the lightness of the colors.
+            a: Array with the opacity of the colors. Defaults to ``None``, which means the colors
+                will be fully opaque.
+            max_h: What is the maximum value for the `h` component.
+            max_sla: What is the maximum value for the `s`, `l` and `a` components.
+        """
+        h, s, l, alpha = cls._scale_hue_based(
+            h, s, l, a, max_h, max_sla, "'s', 'l' and 'a' must be greater than 0 and smaller than 'max_sla'"
+        )
+        return cls._from_rgb(hls_to_rgb_array(h, l, s), alpha)
+
+    @classmethod
+    def from_hsv(cls, h, s, v, a=None, max_h=360, max_sva=1) -> "ColorArray":
+        """Creates a :class:`ColorArray` from arrays with the components of HSV colors.
+
+        All colors are converted at once, which is much faster than creating a
+        :class:`~colorir.color_class.HSV` object for each of them.
+
+        Args:
+            h: Array with the hue of the colors.
+            s: Array with the saturation of the colors.
+            v: Array with the value of the colors.
+            a: Array with the opacity of the colors. Defaults to ``None``, which means the colors
+                will be fully opaque.
+            max_h: What is the maximum value for the `h` component.
+            max_sva: What is the maximum value for the `s`, `v` and `a` components.
+        """
+        h, s, v, alpha = cls._scale_hue_based(
+            h, s, v, a, max_h, max_sva, "'s', 'v' and 'a' must be greater than 0 and smaller than 'max_sva'"
+        )
+        return cls._from_rgb(hsv_to_rgb_array(h, s, v), alpha)
+
+    @classmethod
+    def from_cielab(cls, l, a_, b, a=None, max_a=1) -> "ColorArray":
+        """Creates a :class:`ColorArray` from arrays with the components of CIELab colors.
+
+        All colors are converted at once, which is much faster than creating a
+        :class:`~colorir.color_class.CIELab` object for each of them.
+
+        Args:
+            l: Array with the lightness of the colors, in the range 0-100.
+            a_: Array with the green-red component of the colors.
+            b: Array with the blue-yellow component of the colors.
+            a: Array with the opacity of the colors. Defaults to ``None``, which means the colors
+                will be fully opaque.
+            max_a: What is the maximum value for the `a` component.
+        """
+        l, a_, b = np.broadcast_arrays(*(np.asarray(comp, dtype=float) for comp in (l, a_, b)))
+        return cls._from_cie(np.stack((l.ravel(), a_.ravel(), b.ravel()), axis=1), a, max_a,
+                             _cie_numba.lab_to_srgb)
+
+    @classmethod
+    def from_hclab(cls, h, c, l, a=None, max_h=360, max_a=1) -> "ColorArray":
+        """Creates a :class:`ColorArray` from arrays with the components of HCLab colors.
+
+        All colors are converted at once, which is much faster than creating a
+        :class:`~colorir.color_class.HCLab` object for each of them.
+
+        Examples:
+            >>> ColorArray.from_hclab([0, 120, 240], 40, 60).to_colors()
+            [Hex('#d17492'), Hex('#829952'), Hex('#009dcd')]
+
+        Args:
+            h: Array with the hue of the colors.
+            c: Array with the chroma of the colors.
+            l: Array with the lightness of the colors, in the range 0-100.
+            a: Array with the opacity of the colors. Defaults to ``None``, which means the colors
+                will be fully opaque.
+            max_h: What is the maximum value for the `h` component.
+            max_a: What is the maximum value for the `a` component.
+        """
+        h, c, l = np.broadcast_arrays(*(np.asarray(comp, dtype=float).ravel() for comp in (h, c, l)))
+        h = np.radians(h / max_h * 360 % 360)
+        return cls._from_cie(np.stack((l, np.cos(h) * c, np.sin(h) * c), axis=1), a, max_a,
+                             _cie_numba.lab_to_srgb)
+
+    @classmethod
+    def from_cieluv(cls, l, u, v, a=None, max_a=1) -> "ColorArray":
+        """Creates a :class:`ColorArray` from arrays with the components of CIELuv colors.
+
+        All colors are converted at once, which is much faster than creating a
+        :class:`~colorir.color_class.CIELuv` object for each of them.
+
+        Args:
+            l: Array with the lightness of the colors, in the range 0-100.
+            u: Array with the u component of the colors.
+            v: Array with the v component of the colors.
+            a: Array with the opacity of the colors. Defaults to ``None``, which means the colors
+                will be fully opaque.
+            max_a: What is the maximum value for the `a` component.
+        """
+        l, u, v = np.broadcast_arrays(*(np.asarray(comp, dtype=float) for comp in (l, u, v)))
+        return cls._from_cie(np.stack((l.ravel(), u.ravel(), v.ravel()), axis=1), a, max_a,
+                             _cie_numba.luv_to_srgb)
+
+    @classmethod
+    def from_hcluv(cls, h, c, l, a=None, max_h=360, max_a=1) -> "ColorArray":
+        """Creates a :class:`ColorArray` from arrays with the components of HCLuv colors.
+
+        All colors are converted at once, which is much faster than creating a
+        :class:`~colorir.color_class.HCLuv` object for each of them.
+
+        Args:
+            h: Array with the hue of the colors.
+            c: Array with the chroma of the colors.
+            l: Array with the lightness of the colors, in the range 0-100.
+            a: Array with the opacity of the colors. Defaults to ``None``, which means the colors
+                will be fully opaque.
+            max_h: What is the maximum value for the `h` component.
+            max_a: What is the maximum value for the `a` component.
+        """
+        h, c, l = np.broadcast_arrays(*(np.asarray(comp, dtype=float).ravel() for comp in (h, c, l)))
+        h = np.radians(h / max_h * 360 % 360)
+        return cls._from_cie(np.stack((l, np.cos(h) * c, np.sin(h) * c), axis=1), a, max_a,
+                             _cie_numba.luv_to_srgb)
+
+    # Scales the components of HSL or HSV colors to the range 0-1 (and the alpha to 0-255) with the
+    # same operations as the color classes
+    @staticmethod
+    def _scale_hue_based(h, comp1, comp2, a, max_h, max_comp, error_msg):
+        h, comp1, comp2 = np.broadcast_arrays(*(np.asarray(comp, dtype=float).ravel()
+                                                for comp in (h, comp1, comp2)))
+        a = np.broadcast_to(np.asarray(max_comp if a is None else a, dtype=float).ravel(), h.shape)
+        if any(np.any((comp < 0) | (comp > max_comp)) for comp in (comp1, comp2, a)):
+            raise ValueError(error_msg)
+        inv_comp = 1.0 / max_comp
+        return h % max_h / max_h, comp1 * inv_comp, comp2 * inv_comp, a * inv_comp * 255
+
+    @classmethod
+    def _from_rgb(cls, rgb, alpha):
+        r, g, b = rgb
+        return cls.from_rgba(np.rint(np.column_stack((r * 255, g * 255, b * 255, alpha))))
+
+    @classmethod
+    def _from_cie(cls, cie, a, max_a, to_srgb):
+        if np.any((cie[:, 0] < 0) | (cie[:, 0] > 100)):
+            raise ValueError("'l' must be greater than 0 and smaller than 100")
+        if a is None:
+            alpha = np.full(len(cie), 255.0)
+        else:
+            a = np.asarray(a, dtype=float)
+            if np.any((a < 0) | (a > max_a)):
+                raise ValueError("'a' must be greater than 0 and smaller than 'max_a'")
+            alpha = np.broadcast_to(a / max_a * 255, (len(cie),))
+        rgb = to_srgb(cie) * 255
+        return cls.from_rgba(np.rint(np.column_stack((rgb, alpha))))
+
+    @property
+    def rgba(self) -> np.ndarray:
+        """Array of shape (N, 4) with the RGBA values of the colors."""
+        return np.stack((self.r, self.g, self.b, self.a), axis=1)
+
+    def to_colors(self, color_format: ColorFormat = None) -> List[ColorBase]:
+        """Creates a color object for each color of the array.
+
+        Args:
+            color_format: Format of the created colors. Defaults to :data:`config.DEFAULT_COLOR_FORMAT
+                <colorir.config.DEFAULT_COLOR_FORMAT>`.
+        """
+        if color_format is None:
+            color_format = config.DEFAULT_COLOR_FORMAT
+        return color_format._from_rgba_array(self.rgba)
+
+    def hls(self):
+        """Returns the hue, lightness and saturation of the colors as three arrays with values in the
+        range 0-1 (see :func:`colorsys.rgb_to_hls`)."""
+        return rgb_to_hls_array(self.r / 255, self.g / 255, self.b / 255)
+
+    def hsv(self):
+        """Returns the hue, saturation and value of the colors as three arrays with values in the range
+        0-1 (see :func:`colorsys.rgb_to_hsv`)."""
+        return rgb_to_hsv_array(self.r / 255, self.g / 255, self.b / 255)
+
+    def __len__(self):
+        return len(self.r)
+
+    def __getitem__(self, item):
+        if isinstance(item, (int, np.integer)):
+            return config.DEFAULT_COLOR_FORMAT._from_rgba(
+                np.array((self.r[item], self.g[item], self.b[item], self.a[item]), dtype=int)
+            )
+        obj = self.__class__.__new__(self.__class__)
+        obj.r, obj.g, obj.b, obj.a = self.r[item], self.g[item], self.b[item], self.a[item]
+        return obj
+
+    def __iter__(self):
+        return iter(self.to_colors())
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.to_colors()})"
@@ -33,26 +33,30 @@ Examples:
     >>> HSV(0.0, 1.0, 1.0) * (1, 0.5, 1)
     HSV(0.0, 0.5, 1.0)
 
+    Colors are immutable, since colors created from the same arguments may be the same object.
+    To change the format of a color, create a new one instead:
+
+    >>> red = RGB(1, 0, 0)
+    >>> red.max_rgb = 255
+    Traceback (most recent call last):
+      ...
+    AttributeError: 'RGB' objects are immutable
+    >>> red.rgb(max_rgb=255)
+    RGB(255.0, 0.0, 0.0)
+
 References:
     .. [#] Wikipedia at https://en.wikipedia.org/wiki/Color_model.
 """
 import abc
 import colorsys
+import functools
 import operator
 import warnings
 
 import numpy as np
-from typing import List, Union
-from .colormath.color_objects import (
-    LabColor,
-    LuvColor,
-    LCHuvColor,
-    sRGBColor,
-    LCHabColor,
-    CMYColor,
-    CMYKColor
-)
-from .colormath.color_conversions import convert_color
+from typing import Tuple, Union
+from . import _cie, _cie_numba
+from ._colorsys import rgb_to_hls_array, rgb_to_hsv_array
 
 import colorir
 
@@ -80,9 +84,16 @@ class ColorBase(metaclass=abc.ABCMeta):
 
     Notes:
         This class is abstract and should not be instantiated.
+
+        Color objects are immutable: setting or deleting any of their attributes raises an
+        `AttributeError`.
     """
+    # Empty so that subclasses which define their own __slots__ (such as Hex) have no __dict__
+    __slots__ = ()
     _rgba: np.ndarray
-    _format_params: List[str]
+    # The 8-bit RGBA values packed into a single int, used for hashing and comparisons
+    _rgba_u32: int
+    _format_params: Tuple[str, ...]
 
     # Factory method to be called when reading the palette files or reconstructing colors
     @classmethod
@@ -90,27 +101,68 @@ class ColorBase(metaclass=abc.ABCMeta):
     def _from_rgba(cls, rgba, **kwargs):
         pass
 
+    @classmethod
+    def from_array(cls, rgba, **kwargs) -> list:
+        """Creates one color for each row of an array of RGB(A) values.
+
+        Converting many colors at once like this is much faster than creating each of them
+        individually, since most color systems convert the whole array in a single step.
+
+        Examples:
+            >>> HSL.from_array([[255, 0, 0], [0, 0, 255]], max_sla=100)
+            [HSL(0.0, 100.0, 50.0), HSL(240.0, 100.0, 50.0)]
+
+        Args:
+            rgba: Array-like of shape (N, 3) or (N, 4) with RGB(A) values in the range 0-255.
+                If the alpha column is omitted the colors will be fully opaque.
+            **kwargs: Keyword arguments that will be passed on to the constructor of this class
+                (e.g.: `max_h` or `include_a`).
+        """
+        rgba = np.asarray(rgba)
+        if rgba.ndim != 2 or rgba.shape[1] not in (3, 4):
+            raise ValueError("'rgba' must be an array of shape (N, 3) or (N, 4)")
+        # Out of range values would otherwise wrap around when converted to 8-bit integers
+        if len(rgba) and (rgba.min() < 0 or rgba.max() > 255):
+            raise ValueError("the values of 'rgba' must be in the range 0-255")
+        if rgba.shape[1] == 3:
+            rgba = np.concatenate([rgba, np.full((len(rgba), 1), 255)], axis=1)
+        return cls._from_rgba_array(rgba, **kwargs)
+
+    # Builds one color per row of an (N, 4) array of RGBA values, subclasses may vectorize this
+    @classmethod
+    def _from_rgba_array(cls, rgba, **kwargs):
+        return [cls._from_rgba(row, **kwargs) for row in _rgba_array(rgba)]
+
     @property
     def format(self) -> "colorir.color_format.ColorFormat":
         """Returns a :class:`~colorir.color_format.ColorFormat` representing the format of this
         color object."""
-        format_ = {param: getattr(self, param) for param in self._format_params}
-        return colorir.color_format.ColorFormat(self.__class__, **format_)
+        return colorir.color_format.ColorFormat(self.__class__,
+                                                **{param: getattr(self, param) for param in self._format_params})
+
+    # Same as 'format', but shared between colors of the same format so it must never be modified
+    @property
+    def _format(self):
+        return _cached_format(self.__class__, *[getattr(self, param) for param in self._format_params])
 
     def __eq__(self, other):
+        if self is other:
+            return True
         try:
-            if not isinstance(other, ColorBase):
+            if type(other) is not type(self) and not isinstance(other, ColorBase):
                 other = colorir.config.DEFAULT_COLOR_FORMAT.format(other)
-            return np.all(np.rint(self._rgba) == np.rint(other._rgba))
+            # Colors are equal if their 8-bit RGBA values are, which is a single int comparison
+            return self._rgba_u32 == other._rgba_u32
         except colorir.color_format.FormatError:
             return NotImplemented
 
     def __hash__(self):
-        return hash(tuple(self._rgba))
+        # Must be the same for all color classes so that equal colors have equal hashes
+        return hash(self._rgba_u32)
 
     def __invert__(self):
         """Gets the inverse RGB of this color."""
-        return self.format._from_rgba(np.append(255 - self._rgba[:-1], self._rgba[-1]))
+        return self._format._from_rgba(np.append(255 - self._rgba[:-1], self._rgba[-1]))
 
     def __mod__(self, other):
         """Blends two colors at 50% using :func:`colorir.utils.blend()`."""
@@ -135,7 +187,7 @@ class ColorBase(metaclass=abc.ABCMeta):
     def grayscale(self):
         """Converts this color to a grayscale representation in the same format using CIE
         lightness component."""
-        return self.format.format(CIELuv(self.cieluv().l, 0, 0))
+        return self._format.format(CIELuv(self.cieluv().l, 0, 0))
 
     def hex(self, **kwargs) -> "Hex":
         """Converts the current color to a hexadecimal representation.
@@ -230,8 +282,13 @@ class ColorBase(metaclass=abc.ABCMeta):
     def _arithm_func(self, other, foo):
         if not isinstance(other, ColorTupleBase):
             raise ValueError("operations are only possible if one of the colors is tuple-based")
-        vals = tuple(map(foo, other.format.format(self), other))
-        return self.format.format(other.format.format(vals))
+        self_format = self._format
+        other_format = other._format
+        # Formats are shared between colors, so this skips both conversions when they are the same
+        if self_format is other_format:
+            return other_format.format(_elementwise(foo, self, other))
+        vals = _elementwise(foo, other_format._from_rgba(self._rgba), other)
+        return self_format._from_rgba(other_format.format(vals)._rgba)
 
 
 class ColorTupleBase(ColorBase, tuple, metaclass=abc.ABCMeta):
@@ -240,27 +297,71 @@ class ColorTupleBase(ColorBase, tuple, metaclass=abc.ABCMeta):
     Notes:
         This class is abstract and should not be instantiated.
     """
+    _format_params = ("include_a", "round_to")
+    # Format parameters are only stored in the instances when they differ from these class-level
+    # defaults, which keeps the '__dict__' of most colors small
+    include_a = False
+    round_to = -1
+    _format_defaults = {"include_a": False, "round_to": -1}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Collected once since resolving the defaults through the MRO on every construction is slow
+        cls._format_defaults = {param: getattr(cls, param) for param in cls._format_params}
 
     @abc.abstractmethod
-    def __new__(cls, specs, a, rgba, include_a, round_to):
-        specs = list(specs)
-        if round_to == 0:
-            specs = [round(val) for val in specs]
-            a = round(a)
-        elif round_to > 0:
-            specs = [round(val, round_to) for val in specs]
-            a = round(a, round_to)
-        if include_a:
-            specs.append(a)
-        obj = tuple.__new__(cls, specs)
-        obj.a = a
-        obj.include_a = include_a
-        obj.round_to = round_to
-        obj._rgba = np.rint(rgba).astype(int)
-        obj._format_params = ["include_a", "round_to"]
+    def __new__(cls, specs, a, rgba, include_a, round_to, **format_params):
+        format_params["include_a"] = include_a
+        format_params["round_to"] = round_to
+        return cls._new(specs, a, rgba, cls._non_default_params(format_params))
+
+    @classmethod
+    def _non_default_params(cls, format_params):
+        defaults = cls._format_defaults
+        # Most colors use the default format, which is checked in a single comparison
+        if format_params == defaults:
+            return {}
+        return {param: value for param, value in format_params.items() if value != defaults[param]}
+
+    # Builds one color per row of 'rgba' from the already converted components and alphas
+    @classmethod
+    def _new_many(cls, rgba, specs, alphas, **format_params):
+        format_params = cls._non_default_params(format_params)
+        return [cls._new(spec, a, row, format_params) for row, spec, a in zip(rgba, specs, alphas)]
+
+    # Creates a color from the format parameters returned by '_non_default_params'
+    @classmethod
+    def _new(cls, specs, a, rgba, format_params):
+        if format_params:
+            round_to = format_params.get("round_to", -1)
+            # Components are not rounded by default, in which case they are used as they are
+            if round_to >= 0:
+                if round_to == 0:
+                    specs = list(map(round, specs))
+                    a = round(a)
+                else:
+                    specs = [round(val, round_to) for val in specs]
+                    a = round(a, round_to)
+            if format_params.get("include_a", False):
+                specs = (*specs, a)
+            obj = tuple.__new__(cls, specs)
+            obj.__dict__.update(format_params)
+        else:
+            obj = tuple.__new__(cls, specs)
+        rgba = _rgba_array(rgba)
+        # Colors are immutable (see '__setattr__'), so their attributes are written to '__dict__'
+        obj.__dict__.update(a=a, _rgba=rgba, _rgba_u32=_pack_rgba(rgba))
 
         return obj
 
+    # Colors are shared between all the places that build them from the same arguments, so changing
+    # the attributes of one of them would affect the others
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{self.__class__.__name__}' objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{self.__class__.__name__}' objects are immutable")
+
     # It would be dangerous to change str conversion as the target framework could call it
     # expecting (255, 0, 0) and get RGB(255, 0, 0)
     def __str__(self):
@@ -273,16 +374,17 @@ class ColorTupleBase(ColorBase, tuple, metaclass=abc.ABCMeta):
             return str(self)
         return colorir.utils.swatch(self, file=None)
 
-    def __hash__(self):
-        return ColorBase.__hash__(self)
+    # Must be assigned explicitly since defining __eq__ unsets the inherited __hash__
+    __hash__ = ColorBase.__hash__
 
     def __eq__(self, other):
-        colorbase_eq = ColorBase.__eq__(self, other)
-        # If other is ColorBase than we trust the result of eq
+        if self is other:
+            return True
+        # If other is ColorBase we only need to compare the 8-bit RGBA values
         if isinstance(other, ColorBase):
-            return colorbase_eq
-        # Otherwise we also try tuple.__eq__
-        return any([colorbase_eq is True, tuple.__eq__(self, other) is True])
+            return self._rgba_u32 == other._rgba_u32
+        # Otherwise we also try tuple.__eq__ (which may return NotImplemented)
+        return ColorBase.__eq__(self, other) is True or tuple.__eq__(self, other) is True
 
     def __add__(self, other):
         return self._tup_arithm_func(other, operator.add)
@@ -299,8 +401,8 @@ class ColorTupleBase(ColorBase, tuple, metaclass=abc.ABCMeta):
     # If right side of the operator is not a tuple-based color, we perform the operation element-wise
     def _tup_arithm_func(self, other, foo):
         if not isinstance(other, ColorBase):
-            vals = tuple(map(foo, self, other))
-            return self.format.format(vals)
+            vals = _elementwise(foo, self, other)
+            return self._format.format(vals)
         return ColorBase._arithm_func(self, other, foo)
 
 
@@ -339,6 +441,13 @@ class RGB(ColorTupleBase):
         linear: Whether the values are linear RGB or sRGB. It is strongly advised not to keep values as
             linear RGB, but it can be useful for quick conversions.
     """
+    _format_params = ("include_a", "round_to", "max_rgb", "max_a", "linear")
+    max_rgb = 1
+    max_a = 1
+    linear = False
+    r = property(operator.itemgetter(0), doc="Red component of the color.")
+    g = property(operator.itemgetter(1), doc="Green component of the color.")
+    b = property(operator.itemgetter(2), doc="Blue component of the color.")
 
     def __new__(cls,
                 r: float,
@@ -350,57 +459,82 @@ class RGB(ColorTupleBase):
                 include_a=False,
                 round_to=-1,
                 linear=False):
+        try:
+            return _cached_tuple_color(cls, r, g, b, a, max_rgb, max_a, include_a, round_to, linear)
+        except TypeError:
+            # Unhashable arguments (e.g. NumPy arrays) are never cached
+            return cls._create(r, g, b, a, max_rgb, max_a, include_a, round_to, linear)
+
+    @classmethod
+    def _create(cls, r, g, b, a, max_rgb, max_a, include_a, round_to, linear):
         if a is None:
             a = max_a
         elif not 0 <= a <= max_a:
             raise ValueError("'a' must be greater than 0 and smaller than 'max_a'")
-        if not all(0 <= spec <= max_rgb for spec in (r, g, b)):
+        if r < 0 or r > max_rgb or g < 0 or g > max_rgb or b < 0 or b > max_rgb:
             raise ValueError("'r', 'g' and 'b' must be greater than 0 and smaller than 'max_rgb'")
 
-        rgba = np.array((r, g, b, a), dtype=float)
-        rgba[:3] /= max_rgb
-        rgba[-1] /= max_a
         if linear:
-            rgba = colorir.utils._to_srgb(rgba)
-        rgba *= 255
+            inv_rgb = 1.0 / max_rgb
+            rgba = np.array((r * inv_rgb, g * inv_rgb, b * inv_rgb, a / max_a))
+            rgba = colorir.utils._to_srgb(rgba) * 255
+        elif max_rgb == 255:
+            # Components are already in the 0-255 range used by '_rgba'
+            rgba = (r, g, b, a if max_a == 255 else a / max_a * 255)
+        elif max_rgb == 1 and max_a == 1:
+            # Default arguments
+            rgba = (r * 255, g * 255, b * 255, a * 255)
+        else:
+            inv_rgb = 1.0 / max_rgb
+            rgba = (r * inv_rgb * 255, g * inv_rgb * 255, b * inv_rgb * 255, a / max_a * 255)
 
-        obj = super().__new__(
+        return super().__new__(
             cls,
             (r, g, b),
             a,
             rgba,
             include_a=include_a,
-            round_to=round_to
+            round_to=round_to,
+            max_rgb=max_rgb,
+            max_a=max_a,
+            linear=linear
         )
-        obj.r, obj.g, obj.b = obj[:3]
-        obj.max_rgb = max_rgb
-        obj.max_a = max_a
-        obj.linear = linear
-        obj._format_params += ["max_rgb", "max_a", "linear"]
-
-        return obj
 
     @classmethod
     def _from_rgba(cls, rgba, max_rgb=1, max_a=1, include_a=False, round_to=-1, linear=False):
-        rgb = rgba / 255
+        rgba = _rgba_array(rgba)
+        # Scaling Python floats is faster than creating temporary NumPy arrays for a single color
         if linear:
-            rgb = colorir.utils._to_linear_rgb(rgb)
-        rgb = rgb[:-1]
-        rgb *= max_rgb
+            r, g, b = colorir.utils._to_linear_rgb_8bit(rgba)[:-1].tolist()
+            rgb = (r * max_rgb, g * max_rgb, b * max_rgb)
+        else:
+            r, g, b, _ = rgba.tolist()
+            rgb = (r / 255 * max_rgb, g / 255 * max_rgb, b / 255 * max_rgb)
 
         obj = super().__new__(cls,
                               rgb,
-                              rgba[-1] / 255 * max_a,
+                              rgba.item(3) / 255 * max_a,
                               rgba,
                               include_a=include_a,
-                              round_to=round_to)
-        obj.r, obj.g, obj.b = obj[:3]
-        obj.max_rgb = max_rgb
-        obj.max_a = max_a
-        obj.linear = linear
-        obj._format_params += ["max_rgb", "max_a", "linear"]
+                              round_to=round_to,
+                              max_rgb=max_rgb,
+                              max_a=max_a,
+                              linear=linear)
         return obj
 
+    @classmethod
+    def _from_rgba_array(cls, rgba, max_rgb=1, max_a=1, include_a=False, round_to=-1, linear=False):
+        rgba = _rgba_array(rgba)
+        if linear:
+            rgbs = colorir.utils._to_linear_rgb_8bit(rgba)[:, :-1]
+        else:
+            rgbs = rgba[:, :-1] / 255
+        rgbs = (rgbs * max_rgb).tolist()
+        alphas = (rgba[:, 3] / 255 * max_a).tolist()
+
+        return cls._new_many(rgba, rgbs, alphas, include_a=include_a, round_to=round_to,
+                             max_rgb=max_rgb, max_a=max_a, linear=linear)
+
 
 class HSL(ColorPolarBase):
     """Represents a color in the HSL color space [#]_.
@@ -424,6 +558,16 @@ class HSL(ColorPolarBase):
             this parameter to 0 ensures that the components will be of type `int`. -1
             means that the components won't be rounded at all.
     """
+    _format_params = ("include_a", "round_to", "max_h", "max_sla")
+    max_h = 360
+    max_sla = 1
+    h = property(operator.itemgetter(0), doc="Hue component of the color.")
+    s = property(operator.itemgetter(1), doc="Saturation component of the color.")
+    l = property(operator.itemgetter(2), doc="Lightness component of the color.")
+
+    # Bound at class level to avoid resolving the colorsys module attributes on every call
+    _hls_to_rgb = staticmethod(colorsys.hls_to_rgb)
+    _rgb_to_hls = staticmethod(colorsys.rgb_to_hls)
 
     def __new__(cls,
                 h: float,
@@ -434,44 +578,63 @@ class HSL(ColorPolarBase):
                 max_sla=1,
                 include_a=False,
                 round_to=-1):
+        try:
+            return _cached_tuple_color(cls, h, s, l, a, max_h, max_sla, include_a, round_to)
+        except TypeError:
+            # Unhashable arguments (e.g. NumPy arrays) are never cached
+            return cls._create(h, s, l, a, max_h, max_sla, include_a, round_to)
+
+    @classmethod
+    def _create(cls, h, s, l, a, max_h, max_sla, include_a, round_to):
         if a is None:
             a = max_sla
-        if not all(0 <= spec <= max_sla for spec in (s, l, a)):
+        if s < 0 or s > max_sla or l < 0 or l > max_sla or a < 0 or a > max_sla:
             raise ValueError("'s', 'l' and 'a' must be greater than 0 and smaller than 'max_sla'")
 
-        rgba = colorsys.hls_to_rgb(h % max_h / max_h, l / max_sla, s / max_sla) + (a / max_sla,)
+        inv_sla = 1.0 / max_sla
+        r, g, b = cls._hls_to_rgb(h % max_h / max_h, l * inv_sla, s * inv_sla)
+        # Scaling the tuple in Python avoids creating a NumPy array for a single color
+        rgba = (r * 255, g * 255, b * 255, a * inv_sla * 255)
 
-        obj = super().__new__(cls,
-                              (h, s, l),
-                              a,
-                              np.array(rgba) * 255,
-                              include_a=include_a,
-                              round_to=round_to)
-        obj.h, obj.s, obj.l = obj[:3]
-        obj.max_h = max_h
-        obj.max_sla = max_sla
-        obj._format_params += ["max_h", "max_sla"]
-
-        return obj
+        return super().__new__(cls,
+                               (h, s, l),
+                               a,
+                               rgba,
+                               include_a=include_a,
+                               round_to=round_to,
+                               max_h=max_h,
+                               max_sla=max_sla)
 
     @classmethod
     def _from_rgba(cls, rgba, max_h=360, max_sla=1, include_a=False, round_to=-1):
-        hls = colorsys.rgb_to_hls(*np.array(rgba[:-1]) / 255)
+        rgba = _rgba_array(rgba)
+        # Python floats are much faster than NumPy scalars in the pure Python colorsys functions
+        r, g, b, a = rgba.tolist()
+        hls = cls._rgb_to_hls(r / 255, g / 255, b / 255)
         hsl = (hls[0] * max_h, hls[2] * max_sla, hls[1] * max_sla)
 
         obj = super().__new__(cls,
                               hsl,
-                              rgba[-1] / 255 * max_sla,
+                              a / 255 * max_sla,
                               rgba,
                               include_a=include_a,
-                              round_to=round_to)
-        obj.h, obj.s, obj.l = obj[:3]
-        obj.max_h = max_h
-        obj.max_sla = max_sla
-        obj._format_params += ["max_h", "max_sla"]
+                              round_to=round_to,
+                              max_h=max_h,
+                              max_sla=max_sla)
 
         return obj
 
+    @classmethod
+    def _from_rgba_array(cls, rgba, max_h=360, max_sla=1, include_a=False, round_to=-1):
+        # Converts all colors at once, only the construction of the objects is left to the loop
+        rgba = _rgba_array(rgba)
+        h, l, s = rgb_to_hls_array(*(rgba[:, :3] / 255).T)
+        hsls = zip((h * max_h).tolist(), (s * max_sla).tolist(), (l * max_sla).tolist())
+        alphas = (rgba[:, 3] / 255 * max_sla).tolist()
+
+        return cls._new_many(rgba, hsls, alphas, include_a=include_a, round_to=round_to,
+                             max_h=max_h, max_sla=max_sla)
+
 
 class HSV(ColorPolarBase):
     """Represents a color in the HSV color space [#]_.
@@ -496,6 +659,15 @@ class HSV(ColorPolarBase):
             this parameter to 0 ensures that the components will be of type `int`. -1
             means that the components won't be rounded at all.
     """
+    _format_params = ("include_a", "round_to", "max_h", "max_sva")
+    max_h = 360
+    max_sva = 1
+    h = property(operator.itemgetter(0), doc="Hue component of the color.")
+    s = property(operator.itemgetter(1), doc="Saturation component of the color.")
+    v = property(operator.itemgetter(2), doc="Value component of the color.")
+
+    _hsv_to_rgb = staticmethod(colorsys.hsv_to_rgb)
+    _rgb_to_hsv = staticmethod(colorsys.rgb_to_hsv)
 
     def __new__(cls,
                 h: float,
@@ -506,44 +678,63 @@ class HSV(ColorPolarBase):
                 max_sva=1,
                 include_a=False,
                 round_to=-1):
+        try:
+            return _cached_tuple_color(cls, h, s, v, a, max_h, max_sva, include_a, round_to)
+        except TypeError:
+            # Unhashable arguments (e.g. NumPy arrays) are never cached
+            return cls._create(h, s, v, a, max_h, max_sva, include_a, round_to)
+
+    @classmethod
+    def _create(cls, h, s, v, a, max_h, max_sva, include_a, round_to):
         if a is None:
             a = max_sva
-        if not all(0 <= spec <= max_sva for spec in (s, v, a)):
+        if s < 0 or s > max_sva or v < 0 or v > max_sva or a < 0 or a > max_sva:
             raise ValueError("'s', 'v' and 'a' must be greater than 0 and smaller than 'max_sva'")
 
-        rgba = colorsys.hsv_to_rgb(h % max_h / max_h, s / max_sva, v / max_sva) + (a / max_sva,)
-
-        obj = super().__new__(cls,
-                              (h, s, v),
-                              a,
-                              np.array(rgba) * 255,
-                              include_a=include_a,
-                              round_to=round_to)
-        obj.h, obj.s, obj.v = obj[:3]
-        obj.max_h = max_h
-        obj.max_sva = max_sva
-        obj._format_params += ["max_h", "max_sva"]
+        inv_sva = 1.0 / max_sva
+        r, g, b = cls._hsv_to_rgb(h % max_h / max_h, s * inv_sva, v * inv_sva)
+        # Scaling the tuple in Python avoids creating a NumPy array for a single color
+        rgba = (r * 255, g * 255, b * 255, a * inv_sva * 255)
 
-        return obj
+        return super().__new__(cls,
+                               (h, s, v),
+                               a,
+                               rgba,
+                               include_a=include_a,
+                               round_to=round_to,
+                               max_h=max_h,
+                               max_sva=max_sva)
 
     @classmethod
     def _from_rgba(cls, rgba, max_h=360, max_sva=1, include_a=False, round_to=-1):
-        hsv = colorsys.rgb_to_hsv(*np.array(rgba[:-1]) / 255)
+        rgba = _rgba_array(rgba)
+        # Python floats are much faster than NumPy scalars in the pure Python colorsys functions
+        r, g, b, a = rgba.tolist()
+        hsv = cls._rgb_to_hsv(r / 255, g / 255, b / 255)
         hsv = (hsv[0] * max_h, hsv[1] * max_sva, hsv[2] * max_sva)
 
         obj = super().__new__(cls,
                               hsv,
-                              rgba[-1] / 255 * max_sva,
+                              a / 255 * max_sva,
                               rgba,
                               include_a=include_a,
-                              round_to=round_to)
-        obj.h, obj.s, obj.v = obj[:3]
-        obj.max_h = max_h
-        obj.max_sva = max_sva
-        obj._format_params += ["max_h", "max_sva"]
+                              round_to=round_to,
+                              max_h=max_h,
+                              max_sva=max_sva)
 
         return obj
 
+    @classmethod
+    def _from_rgba_array(cls, rgba, max_h=360, max_sva=1, include_a=False, round_to=-1):
+        # Converts all colors at once, only the construction of the objects is left to the loop
+        rgba = _rgba_array(rgba)
+        h, s, v = rgb_to_hsv_array(*(rgba[:, :3] / 255).T)
+        hsvs = zip((h * max_h).tolist(), (s * max_sva).tolist(), (v * max_sva).tolist())
+        alphas = (rgba[:, 3] / 255 * max_sva).tolist()
+
+        return cls._new_many(rgba, hsvs, alphas, include_a=include_a, round_to=round_to,
+                             max_h=max_h, max_sva=max_sva)
+
 
 class CMYK(ColorTupleBase):
     """Represents a color in the CMYK color space [#]_.
@@ -567,53 +758,80 @@ class CMYK(ColorTupleBase):
             this parameter to 0 ensures that the components will be of type `int`. The default,
             -1, means that the components won't be rounded at all.
     """
+    _format_params = ("include_a", "round_to", "max_cmyka")
+    max_cmyka = 1
+    c = property(operator.itemgetter(0), doc="Cyan component of the color.")
+    m = property(operator.itemgetter(1), doc="Magenta component of the color.")
+    y = property(operator.itemgetter(2), doc="Yellow component of the color.")
+    k = property(operator.itemgetter(3), doc="Key (black) component of the color.")
 
     def __new__(cls, c: float, m: float, y: float, k: float, a: float = None, max_cmyka=1,
                 include_a=False,
                 round_to=-1):
         if a is None:
             a = max_cmyka
-        if not all(0 <= spec <= max_cmyka for spec in (c, m, y, k, a)):
+        if (c < 0 or c > max_cmyka or m < 0 or m > max_cmyka or y < 0 or y > max_cmyka
+                or k < 0 or k > max_cmyka or a < 0 or a > max_cmyka):
             raise ValueError("'c', 'm', 'y', 'k', and 'a' must be greater than 0 and smaller than "
                              "'max_cmyka'")
 
-        rgba = convert_color(
-            CMYKColor(*(np.array((c, m, y, k)) / max_cmyka)),
-            sRGBColor
-        ).get_value_tuple() + (a / max_cmyka,)
+        inv_cmyka = 1.0 / max_cmyka
+        # (1 - c) * (1 - k) is the same as going through CMY, where C = c * (1 - k) + k and R = 1 - C
+        inv_k = (1.0 - k * inv_cmyka) * 255
+        rgba = ((1.0 - c * inv_cmyka) * inv_k,
+                (1.0 - m * inv_cmyka) * inv_k,
+                (1.0 - y * inv_cmyka) * inv_k,
+                a * inv_cmyka * 255)
 
         obj = super().__new__(cls,
                               (c, m, y, k),
                               a,
-                              np.array(rgba) * 255,
+                              rgba,
                               include_a=include_a,
-                              round_to=round_to)
-        obj.c, obj.m, obj.y, obj.k = obj[:4]
-        obj.max_cmyka = max_cmyka
-        obj._format_params.append("max_cmyka")
+                              round_to=round_to,
+                              max_cmyka=max_cmyka)
 
         return obj
 
     @classmethod
     def _from_rgba(cls, rgba, max_cmyka=1, include_a=False, round_to=-1):
-        cmyk = convert_color(
-            sRGBColor(*rgba[:3], is_upscaled=True),
-            CMYKColor
-        ).get_value_tuple()
-        cmyk = np.array(cmyk) * max_cmyka
+        rgba = _rgba_array(rgba)
+        r, g, b, a = rgba.tolist()
+        # Same operations as the RGB -> CMY -> CMYK conversions of colormath
+        c, m, y = 1.0 - r / 255, 1.0 - g / 255, 1.0 - b / 255
+        k = min(c, m, y, 1.0)
+        if k == 1:
+            cmyk = (0.0, 0.0, 0.0, k * max_cmyka)
+        else:
+            inv_k = 1.0 - k
+            cmyk = ((c - k) / inv_k * max_cmyka,
+                    (m - k) / inv_k * max_cmyka,
+                    (y - k) / inv_k * max_cmyka,
+                    k * max_cmyka)
 
         obj = super().__new__(cls,
                               cmyk,
-                              rgba[-1] / 255 * max_cmyka,
+                              a / 255 * max_cmyka,
                               rgba,
                               include_a=include_a,
-                              round_to=round_to)
-        obj.c, obj.m, obj.y, obj.k = obj[:4]
-        obj.max_cmyka = max_cmyka
-        obj._format_params.append("max_cmyka")
+                              round_to=round_to,
+                              max_cmyka=max_cmyka)
 
         return obj
 
+    @classmethod
+    def _from_rgba_array(cls, rgba, max_cmyka=1, include_a=False, round_to=-1):
+        # Same operations as '_from_rgba', with the black case masked rather than branched on
+        rgba = _rgba_array(rgba)
+        cmy = 1.0 - rgba[:, :3] / 255
+        k = np.minimum(cmy.min(axis=1, initial=1.0), 1.0)[:, None]
+        black = k == 1
+        cmy = np.where(black, 0.0, (cmy - k) / np.where(black, 1.0, 1.0 - k) * max_cmyka)
+        cmyks = np.concatenate([cmy, k * max_cmyka], axis=1).tolist()
+        alphas = (rgba[:, 3] / 255 * max_cmyka).tolist()
+
+        return cls._new_many(rgba, cmyks, alphas, include_a=include_a, round_to=round_to, max_cmyka=max_cmyka)
+
 
 class CMY(ColorTupleBase):
     """Represents a color in the CMY color space [#]_.
@@ -637,6 +855,11 @@ class CMY(ColorTupleBase):
             this parameter to 0 ensures that the components will be of type `int`. The default,
             -1, means that the components won't be rounded at all.
     """
+    _format_params = ("include_a", "round_to", "max_cmya")
+    max_cmya = 1
+    c = property(operator.itemgetter(0), doc="Cyan component of the color.")
+    m = property(operator.itemgetter(1), doc="Magenta component of the color.")
+    y = property(operator.itemgetter(2), doc="Yellow component of the color.")
 
     def __new__(cls,
                 c: float,
@@ -648,51 +871,70 @@ class CMY(ColorTupleBase):
                 round_to=-1):
         if a is None:
             a = max_cmya
-        if not all(0 <= spec <= max_cmya for spec in (c, m, y, a)):
+        if (c < 0 or c > max_cmya or m < 0 or m > max_cmya
+                or y < 0 or y > max_cmya or a < 0 or a > max_cmya):
             raise ValueError("'c', 'm', 'y', and 'a' must be greater than 0 and smaller than "
                              "'max_cmya'")
 
-        rgba = convert_color(
-            CMYColor(*(np.array((c, m, y)) / max_cmya)),
-            sRGBColor
-        ).get_value_tuple() + (a / max_cmya,)
+        inv_cmya = 1.0 / max_cmya
+        rgba = ((1.0 - c * inv_cmya) * 255,
+                (1.0 - m * inv_cmya) * 255,
+                (1.0 - y * inv_cmya) * 255,
+                a * inv_cmya * 255)
 
         obj = super().__new__(
             cls,
             (c, m, y),
             a,
-            np.array(rgba) * 255,
+            rgba,
             include_a=include_a,
-            round_to=round_to)
-        obj.c, obj.m, obj.y = obj[:3]
-        obj.max_cmya = max_cmya
-        obj._format_params.append("max_cmya")
+            round_to=round_to,
+            max_cmya=max_cmya)
 
         return obj
 
     @classmethod
     def _from_rgba(cls, rgba, max_cmya=1, include_a=False, round_to=-1):
-        cmy = convert_color(
-            sRGBColor(*rgba[:3], is_upscaled=True),
-            CMYColor
-        ).get_value_tuple()
-        cmy = np.array(cmy) * max_cmya
+        rgba = _rgba_array(rgba)
+        r, g, b, a = rgba.tolist()
+        # Same operations as the RGB -> CMY conversion of colormath
+        cmy = ((1.0 - r / 255.0) * max_cmya, (1.0 - g / 255.0) * max_cmya, (1.0 - b / 255.0) * max_cmya)
 
         obj = super().__new__(cls,
                               cmy,
-                              rgba[-1] / 255 * max_cmya,
+                              a / 255 * max_cmya,
                               rgba,
                               include_a=include_a,
-                              round_to=round_to)
-        obj.c, obj.m, obj.y = obj[:3]
-        obj.max_cmya = max_cmya
-        obj._format_params.append("max_cmya")
+                              round_to=round_to,
+                              max_cmya=max_cmya)
 
         return obj
 
+    @classmethod
+    def _from_rgba_array(cls, rgba, max_cmya=1, include_a=False, round_to=-1):
+        # Same operations as the RGB -> CMY conversion of colormath, applied to all colors at once
+        rgba = _rgba_array(rgba)
+        cmys = ((1.0 - rgba[:, :3] / 255.0) * max_cmya).tolist()
+        alphas = (rgba[:, 3] / 255 * max_cmya).tolist()
+
+        return cls._new_many(rgba, cmys, alphas, include_a=include_a, round_to=round_to, max_cmya=max_cmya)
+
+
+# Minimum number of colors for which the batch CIE conversions use the kernels of _cie_numba. Their
+# first use imports numba and loads the kernels, which takes most of a second, so below this measured
+# break-even point the (cached) per-color conversions are faster. E.g. loading a palette never
+# goes through numba
+_CIE_KERNEL_MIN_SIZE = 250_000
+
 
 # TODO doc
 class CIELuv(ColorTupleBase):
+    _format_params = ("include_a", "round_to", "max_a")
+    max_a = 1
+    l = property(operator.itemgetter(0), doc="Lightness component of the color.")
+    u = property(operator.itemgetter(1), doc="U component of the color.")
+    v = property(operator.itemgetter(2), doc="V component of the color.")
+
     def __new__(cls, l, u, v, a=None, max_a=1, include_a=False, round_to=-1):
         if a is None:
             a = max_a
@@ -701,40 +943,46 @@ class CIELuv(ColorTupleBase):
         if not 0 <= l <= 100:
             raise ValueError("'l' must be greater than 0 and smaller than 100")
 
-        rgb = convert_color(LuvColor(l, u, v, illuminant="d65"), sRGBColor)
-        rgba = (rgb.clamped_rgb_r * 255,
-                rgb.clamped_rgb_g * 255,
-                rgb.clamped_rgb_b * 255,
-                a / max_a * 255)
-        obj = super().__new__(cls, (l, u, v), a, rgba, include_a=include_a, round_to=round_to)
-        obj.l, obj.u, obj.v = obj[:3]
-        obj.max_a = max_a
-        obj._format_params.append("max_a")
+        r, g, b = _cie.luv_to_srgb(l, u, v)
+        rgba = (r * 255, g * 255, b * 255, a / max_a * 255)
+        obj = super().__new__(cls, (l, u, v), a, rgba, include_a=include_a, round_to=round_to, max_a=max_a)
 
         return obj
 
     @classmethod
     def _from_rgba(cls, rgba, max_a=1, include_a=False, round_to=-1):
-        luv = convert_color(
-            sRGBColor(*rgba[:3], is_upscaled=True),
-            LuvColor,
-            target_illuminant="d65"
-        ).get_value_tuple()
+        rgba = _rgba_array(rgba)
+        r, g, b, _ = rgba.tolist()
+        luv = _cie.srgb8_to_luv(r, g, b)
         obj = super().__new__(cls,
                               luv,
                               rgba[-1] / 255 * max_a,
                               rgba,
                               include_a=include_a,
-                              round_to=round_to)
-        obj.l, obj.u, obj.v = obj[:3]
-        obj.max_a = max_a
-        obj._format_params.append("max_a")
+                              round_to=round_to,
+                              max_a=max_a)
 
         return obj
 
+    @classmethod
+    def _from_rgba_array(cls, rgba, max_a=1, include_a=False, round_to=-1):
+        rgba = _rgba_array(rgba)
+        if len(rgba) < _CIE_KERNEL_MIN_SIZE:
+            return super()._from_rgba_array(rgba, max_a=max_a, include_a=include_a, round_to=round_to)
+        luvs = _cie_numba.srgb_to_luv(rgba[:, :3] / 255.0).tolist()
+        alphas = rgba[:, 3] / 255 * max_a
+
+        return cls._new_many(rgba, luvs, alphas, include_a=include_a, round_to=round_to, max_a=max_a)
+
 
 # TODO doc
 class CIELab(ColorTupleBase):
+    _format_params = ("include_a", "round_to", "max_a")
+    max_a = 1
+    l = property(operator.itemgetter(0), doc="Lightness component of the color.")
+    a_ = property(operator.itemgetter(1), doc="A component of the color.")
+    b = property(operator.itemgetter(2), doc="B component of the color.")
+
     def __new__(cls, l, a_, b, a=None, max_a=1, include_a=False, round_to=-1):
         if a is None:
             a = max_a
@@ -743,41 +991,48 @@ class CIELab(ColorTupleBase):
         if not 0 <= l <= 100:
             raise ValueError("'l' must be greater than 0 and smaller than 100")
 
-        rgb = convert_color(LabColor(l, a_, b, illuminant="d65"), sRGBColor)
-        rgba = (rgb.clamped_rgb_r * 255,
-                rgb.clamped_rgb_g * 255,
-                rgb.clamped_rgb_b * 255,
-                a / max_a * 255)
-        obj = super().__new__(cls, (l, a_, b), a, rgba, include_a=include_a, round_to=round_to)
-        obj.l, obj.a_, obj.b = l, a_, b
-        obj.max_a = max_a
-        obj._format_params.append("max_a")
+        r, g, b_ = _cie.lab_to_srgb(l, a_, b)
+        rgba = (r * 255, g * 255, b_ * 255, a / max_a * 255)
+        obj = super().__new__(cls, (l, a_, b), a, rgba, include_a=include_a, round_to=round_to, max_a=max_a)
 
         return obj
 
     @classmethod
     def _from_rgba(cls, rgba, max_a=1, include_a=False, round_to=-1):
-        lab = convert_color(
-            sRGBColor(*rgba[:3], is_upscaled=True),
-            LabColor,
-            target_illuminant="d65"
-        ).get_value_tuple()
+        rgba = _rgba_array(rgba)
+        r, g, b, _ = rgba.tolist()
+        lab = _cie.srgb8_to_lab(r, g, b)
 
         obj = super().__new__(cls,
                               lab,
                               rgba[-1] / 255 * max_a,
                               rgba,
                               include_a=include_a,
-                              round_to=round_to)
-        obj.l, obj.a_, obj.b = obj[:3]
-        obj.max_a = max_a
-        obj._format_params.append("max_a")
+                              round_to=round_to,
+                              max_a=max_a)
 
         return obj
 
+    @classmethod
+    def _from_rgba_array(cls, rgba, max_a=1, include_a=False, round_to=-1):
+        rgba = _rgba_array(rgba)
+        if len(rgba) < _CIE_KERNEL_MIN_SIZE:
+            return super()._from_rgba_array(rgba, max_a=max_a, include_a=include_a, round_to=round_to)
+        labs = _cie_numba.srgb_to_lab(rgba[:, :3] / 255.0).tolist()
+        alphas = rgba[:, 3] / 255 * max_a
+
+        return cls._new_many(rgba, labs, alphas, include_a=include_a, round_to=round_to, max_a=max_a)
+
 
 # TODO doc
 class HCLuv(ColorPolarBase):
+    _format_params = ("include_a", "round_to", "max_h", "max_a")
+    max_h = 360
+    max_a = 1
+    h = property(operator.itemgetter(0), doc="Hue component of the color.")
+    c = property(operator.itemgetter(1), doc="Chroma component of the color.")
+    l = property(operator.itemgetter(2), doc="Lightness component of the color.")
+
     def __new__(cls, h, c, l, a=None, max_h=360, max_a=1, include_a=False, round_to=-1):
         if a is None:
             a = max_a
@@ -786,54 +1041,64 @@ class HCLuv(ColorPolarBase):
         if not 0 <= l <= 100:
             raise ValueError("'l' must be greater than 0 and smaller than 100")
 
-        rgb = convert_color(
-            LCHuvColor(l, c, h / max_h * 360 % 360, illuminant="d65"),
-            sRGBColor
-        )
-        rgba = (rgb.clamped_rgb_r * 255,
-                rgb.clamped_rgb_g * 255,
-                rgb.clamped_rgb_b * 255,
-                a / max_a * 255)
+        r, g, b = _cie.luv_to_srgb(*_cie.lch_to_lab(l, c, h / max_h * 360 % 360))
+        rgba = (r * 255, g * 255, b * 255, a / max_a * 255)
         obj = super().__new__(cls,
                               (h, c, l),
                               a,
                               rgba,
                               include_a=include_a,
-                              round_to=round_to)
-        obj.h, obj.c, obj.l = obj[:3]
-        obj.max_h = max_h
-        obj.max_a = max_a
-        obj._format_params += ["max_h", "max_a"]
+                              round_to=round_to,
+                              max_h=max_h,
+                              max_a=max_a)
 
         return obj
 
     @classmethod
     def _from_rgba(cls, rgba, max_h=360, max_a=1, include_a=False, round_to=-1):
-        hcl = convert_color(
-            sRGBColor(*rgba[:3], is_upscaled=True),
-            LCHuvColor,
-            target_illuminant="d65"
-        ).get_value_tuple()[::-1]
-        hcl = np.array(hcl)
-        hcl[0] *= max_h / 360
+        rgba = _rgba_array(rgba)
+        r, g, b, _ = rgba.tolist()
+        luv = _cie.srgb8_to_luv(r, g, b)
+        l, c, h = _cie.lab_to_lch(*luv)
+        hcl = (h * (max_h / 360), c, l)
         obj = super().__new__(
             cls,
             hcl,
             rgba[-1] / 255 * max_a,
             rgba,
             include_a=include_a,
-            round_to=round_to
+            round_to=round_to,
+            max_h=max_h,
+            max_a=max_a
         )
-        obj.h, obj.c, obj.l = obj[:3]
-        obj.max_h = max_h
-        obj.max_a = max_a
-        obj._format_params += ["max_h", "max_a"]
 
         return obj
 
+    @classmethod
+    def _from_rgba_array(cls, rgba, max_h=360, max_a=1, include_a=False, round_to=-1):
+        rgba = _rgba_array(rgba)
+        if len(rgba) < _CIE_KERNEL_MIN_SIZE:
+            return super()._from_rgba_array(rgba, max_h=max_h, max_a=max_a, include_a=include_a,
+                                            round_to=round_to)
+        luvs = _cie_numba.srgb_to_luv(rgba[:, :3] / 255.0).tolist()
+        # The polar conversion is cheap, so it is done per color to keep the results of the scalar path
+        h_scale = max_h / 360
+        hcls = [(h * h_scale, c, l) for l, c, h in (_cie.lab_to_lch(*luv) for luv in luvs)]
+        alphas = rgba[:, 3] / 255 * max_a
+
+        return cls._new_many(rgba, hcls, alphas, include_a=include_a, round_to=round_to,
+                             max_h=max_h, max_a=max_a)
+
 
 # TODO doc
 class HCLab(ColorPolarBase):
+    _format_params = ("include_a", "round_to", "max_h", "max_a")
+    max_h = 360
+    max_a = 1
+    h = property(operator.itemgetter(0), doc="Hue component of the color.")
+    c = property(operator.itemgetter(1), doc="Chroma component of the color.")
+    l = property(operator.itemgetter(2), doc="Lightness component of the color.")
+
     def __new__(cls, h, c, l, a=None, max_h=360, max_a=1, include_a=False, round_to=-1):
         if a is None:
             a = max_a
@@ -842,54 +1107,67 @@ class HCLab(ColorPolarBase):
         if not 0 <= l <= 100:
             raise ValueError("'l' must be greater than 0 and smaller than 100")
 
-        rgb = convert_color(
-            LCHabColor(l, c, h / max_h * 360 % 360, illuminant="d65"),
-            sRGBColor
-        )
-        rgba = (rgb.clamped_rgb_r * 255,
-                rgb.clamped_rgb_g * 255,
-                rgb.clamped_rgb_b * 255,
-                a / max_a * 255)
+        r, g, b = _cie.lab_to_srgb(*_cie.lch_to_lab(l, c, h / max_h * 360 % 360))
+        rgba = (r * 255, g * 255, b * 255, a / max_a * 255)
         obj = super().__new__(cls,
                               (h, c, l),
                               a,
                               rgba,
                               include_a=include_a,
-                              round_to=round_to)
-        obj.h, obj.c, obj.l = obj[:3]
-        obj.max_h = max_h
-        obj.max_a = max_a
-        obj._format_params += ["max_h", "max_a"]
+                              round_to=round_to,
+                              max_h=max_h,
+                              max_a=max_a)
 
         return obj
 
     @classmethod
     def _from_rgba(cls, rgba, max_h=360, max_a=1, include_a=False, round_to=-1):
-        hcl = convert_color(
-            sRGBColor(*rgba[:3], is_upscaled=True),
-            LCHabColor,
-            target_illuminant="d65"
-        ).get_value_tuple()[::-1]
-        hcl = np.array(hcl)
-        hcl[0] *= max_h / 360
+        rgba = _rgba_array(rgba)
+        r, g, b, _ = rgba.tolist()
+        lab = _cie.srgb8_to_lab(r, g, b)
+        l, c, h = _cie.lab_to_lch(*lab)
+        hcl = (h * (max_h / 360), c, l)
         obj = super().__new__(
             cls,
             hcl,
             rgba[-1] / 255 * max_a,
             rgba,
             include_a=include_a,
-            round_to=round_to
+            round_to=round_to,
+            max_h=max_h,
+            max_a=max_a
         )
-        obj.h, obj.c, obj.l = obj[:3]
-        obj.max_h = max_h
-        obj.max_a = max_a
-        obj._format_params += ["max_h", "max_a"]
 
         return obj
 
+    @classmethod
+    def _from_rgba_array(cls, rgba, max_h=360, max_a=1, include_a=False, round_to=-1):
+        rgba = _rgba_array(rgba)
+        if len(rgba) < _CIE_KERNEL_MIN_SIZE:
+            return super()._from_rgba_array(rgba, max_h=max_h, max_a=max_a, include_a=include_a,
+                                            round_to=round_to)
+        labs = _cie_numba.srgb_to_lab(rgba[:, :3] / 255.0).tolist()
+        # The polar conversion is cheap, so it is done per color to keep the results of the scalar path
+        h_scale = max_h / 360
+        hcls = [(h * h_scale, c, l) for l, c, h in (_cie.lab_to_lch(*lab) for lab in labs)]
+        alphas = rgba[:, 3] / 255 * max_a
+
+        return cls._new_many(rgba, hcls, alphas, include_a=include_a, round_to=round_to,
+                             max_h=max_h, max_a=max_a)
+
 
 default_tail = object()
 
+# Hex objects built from the same arguments are shared, since they are immutable strings. Only the
+# most recently used ones are kept (see '_cached_hex')
+_HEX_CACHE_SIZE = 4096
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+# Two-digit representation of every 8-bit value
+_HEX_LUT = tuple(f"{i:02x}" for i in range(256))
+_HEX_LUT_UPPER = tuple(f"{i:02X}" for i in range(256))
+_HEX_PAIRS = np.array(_HEX_LUT)
+_HEX_PAIRS_UPPER = np.array(_HEX_LUT_UPPER)
+
 
 def _warn_tail():
     warnings.warn("the default value for the 'tail_a' argument will be changed to 'True' "
@@ -928,6 +1206,8 @@ class Hex(ColorBase, str):
         >>> Hex("ff0000", include_a=True, tail_a=True)
         Hex('#ff0000ff')
     """
+    _format_params = ("uppercase", "include_hash", "include_a", "tail_a")
+    __slots__ = ("uppercase", "include_hash", "include_a", "tail_a", "_rgba_u32", "_lazy_rgba")
 
     def __new__(cls,
                 hex_str: str,
@@ -940,26 +1220,43 @@ class Hex(ColorBase, str):
             if include_a or len(hex_str) >= 8:
                 _warn_tail()
 
+        if not isinstance(hex_str, str):
+            return cls._parse(hex_str, uppercase, include_hash, include_a, tail_a)
+        # The cache is keyed by the plain content of the string, since another Hex passed as
+        # 'hex_str' would be compared by its RGBA values
+        return _cached_hex(cls, str.__str__(hex_str), uppercase, include_hash, include_a, tail_a)
+
+    @classmethod
+    def _parse(cls, hex_str, uppercase, include_hash, include_a, tail_a):
         hex_str = hex_str.lstrip("#")
         if len(hex_str) not in (3, 6, 8):
             raise ValueError("'hex_str' length must be 3, 6 or 8 (excluding the optional '#')")
         if len(hex_str) == 3:
-            hex_str = "".join(i + j for i, j in zip(hex_str, hex_str))
-        if len(hex_str) < 8:
-            i = 0
-            a = 255
+            r, g, b = hex_str
+            hex_str = r + r + g + g + b + b
+        # int() also accepts signs, underscores, whitespace and a '0x' prefix, so the digits are
+        # checked beforehand
+        if not _HEX_DIGITS.issuperset(hex_str):
+            raise ValueError(f"invalid hexadecimal string '{hex_str}'")
+        # Decodes all components at once and extracts them with shifts and masks
+        value = int(hex_str, 16)
+        if len(hex_str) == 6:
+            rgba = (value >> 16, value >> 8 & 0xff, value & 0xff, 255)
         elif tail_a:
-            i = 0
-            a = int(hex_str[-2:], 16)
+            rgba = (value >> 24, value >> 16 & 0xff, value >> 8 & 0xff, value & 0xff)
         else:
-            i = 2
-            a = int(hex_str[:2], 16)
-        rgb = (int(hex_str[i:i + 2], 16),
-               int(hex_str[i + 2:i + 4], 16),
-               int(hex_str[i + 4:i + 6], 16))
-        # Rather than modifying the stored string to suit the format specifications we just
-        # delegate that to the _from_rgba method
-        return cls._from_rgba(rgb + (a,),
+            rgba = (value >> 16 & 0xff, value >> 8 & 0xff, value & 0xff, value >> 24)
+        if (len(hex_str) == 8) == include_a:
+            # The digits are already in the requested order, so only the case and '#' may change
+            hex_str = hex_str.upper() if uppercase else hex_str.lower()
+            if include_hash:
+                hex_str = '#' + hex_str
+            r, g, b, a = rgba
+            # The RGBA array is only built if it is needed, since Hex objects are often used just as strings
+            return cls._new(hex_str, None, r << 24 | g << 16 | b << 8 | a, uppercase, include_hash, include_a,
+                            tail_a)
+        # Otherwise we just delegate formatting the string to the _from_rgba method
+        return cls._from_rgba(rgba,
                               uppercase=uppercase,
                               include_hash=include_hash,
                               include_a=include_a,
@@ -972,29 +1269,99 @@ class Hex(ColorBase, str):
             if include_a:
                 _warn_tail()
 
-        rgba = tuple(rgba)
-        hex_str = '%02x%02x%02x' % rgba[:3]
-
-        if include_a:
-            a = '%02x' % rgba[-1]
-            if not tail_a:
-                hex_str = a + hex_str
-            else:
-                hex_str += a
-        if uppercase:
-            hex_str = hex_str.upper()
+        rgba = _rgba_array(rgba)
+        r, g, b, a = rgba.tolist()
+        lut = _HEX_LUT_UPPER if uppercase else _HEX_LUT
+        prefix = '#' if include_hash else ''
+        # Each f-string builds the final string in a single step
+        if not include_a:
+            hex_str = f"{prefix}{lut[r]}{lut[g]}{lut[b]}"
+        elif tail_a:
+            hex_str = f"{prefix}{lut[r]}{lut[g]}{lut[b]}{lut[a]}"
+        else:
+            hex_str = f"{prefix}{lut[a]}{lut[r]}{lut[g]}{lut[b]}"
+        return cls._new(hex_str, rgba, r << 24 | g << 16 | b << 8 | a, uppercase, include_hash, include_a,
+                        tail_a)
+
+    @classmethod
+    def _from_rgba_array(cls, rgba, uppercase=False, include_hash=True, include_a=False,
+                         tail_a=default_tail):
+        if tail_a is default_tail:
+            tail_a = False
+            if include_a:
+                _warn_tail()
+
+        rgba = _rgba_array(rgba)
+        if not include_a:
+            columns = [0, 1, 2]
+        else:
+            columns = [0, 1, 2, 3] if tail_a else [3, 0, 1, 2]
+        # The strings of all colors are formatted at once by indexing the table of hex digit pairs
+        # and then reading the consecutive pairs of each row as a single string
+        pairs = np.ascontiguousarray((_HEX_PAIRS_UPPER if uppercase else _HEX_PAIRS)[rgba[:, columns]])
+        hex_strs = pairs.view(f"U{2 * len(columns)}")[:, 0].tolist()
         if include_hash:
-            hex_str = '#' + hex_str
+            hex_strs = ["#" + hex_str for hex_str in hex_strs]
+        packed = rgba.astype(np.uint32)
+        packed = packed[:, 0] << 24 | packed[:, 1] << 16 | packed[:, 2] << 8 | packed[:, 3]
 
+        objs = []
+        for row, hex_str, rgba_u32 in zip(rgba, hex_strs, packed.tolist()):
+            objs.append(cls._new(hex_str, row, rgba_u32, uppercase, include_hash, include_a, tail_a))
+        return objs
+
+    # Builds the object from an already formatted string and its (read-only) 8-bit RGBA values,
+    # which may be None if they have not been computed yet
+    @classmethod
+    def _new(cls, hex_str, rgba, rgba_u32, uppercase, include_hash, include_a, tail_a):
         obj = str.__new__(cls, hex_str)
-        obj.uppercase = uppercase
-        obj.include_hash = include_hash
-        obj.include_a = include_a
-        obj.tail_a = tail_a
-        obj._rgba = np.rint(rgba).astype(int)
-        obj._format_params = ["uppercase", "include_hash", "include_a", "tail_a"]
+        # Hex objects are immutable (see '__setattr__'), so the slots are set through their descriptors
+        _set_hex_uppercase(obj, uppercase)
+        _set_hex_include_hash(obj, include_hash)
+        _set_hex_include_a(obj, include_a)
+        _set_hex_tail_a(obj, tail_a)
+        _set_hex_lazy_rgba(obj, rgba)
+        _set_hex_rgba_u32(obj, rgba_u32)
         return obj
 
+    # Hex objects are shared between all the places that build them from the same arguments, so
+    # changing the attributes of one of them would affect the others
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{self.__class__.__name__}' objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{self.__class__.__name__}' objects are immutable")
+
+    # Copies and pickles are rebuilt through __new__, since the slots cannot be set afterwards
+    def __reduce__(self):
+        return self.__class__, (str.__str__(self), self.uppercase, self.include_hash, self.include_a,
+                                self.tail_a)
+
+    @property
+    def _rgba(self):
+        rgba = self._lazy_rgba
+        if rgba is None:
+            # Unpacks the RGBA values from '_rgba_u32'
+            packed = self._rgba_u32
+            rgba = _rgba_array((packed >> 24, packed >> 16 & 0xff, packed >> 8 & 0xff, packed & 0xff))
+            _set_hex_lazy_rgba(self, rgba)
+        return rgba
+
+    def hex(self, **kwargs) -> "Hex":
+        """Converts the current color to a hexadecimal representation.
+
+        Args:
+            **kwargs: Keyword arguments wrapped in this function will be passed on to the
+                :class:`Hex` constructor.
+        """
+        # Hex objects hold exact 8-bit values, so converting to the same format is a no-op
+        if type(self) is Hex and (not kwargs.get("include_a") or "tail_a" in kwargs):
+            params = {"uppercase": False, "include_hash": True, "include_a": False, "tail_a": False}
+            params.update(kwargs)
+            if all(getattr(self, param, None) == val for param, val in params.items()):
+                return self
+        return super().hex(**kwargs)
+
     # It would be dangerous to change str conversion as the target framework could call it
     # expecting #ff0000 and get Hex('#ff0000')
     def __str__(self):
@@ -1007,16 +1374,85 @@ class Hex(ColorBase, str):
             return str(self)
         return colorir.utils.swatch(self, file=None)
 
-    def __hash__(self):
-        return ColorBase.__hash__(self)
+    # Must be assigned explicitly since defining __eq__ unsets the inherited __hash__
+    __hash__ = ColorBase.__hash__
 
     def __eq__(self, other):
-        colorbase_eq = ColorBase.__eq__(self, other)
-        # If other is ColorBase than we trust the result of eq
+        if self is other:
+            return True
+        # If other is ColorBase we only need to compare the 8-bit RGBA values
         if isinstance(other, ColorBase):
-            return colorbase_eq
-        # Otherwise we also try str.__eq__
-        return any([colorbase_eq is True, str.__eq__(self, other) is True])
+            return self._rgba_u32 == other._rgba_u32
+        # Otherwise we also try str.__eq__ (which may return NotImplemented)
+        return ColorBase.__eq__(self, other) is True or str.__eq__(self, other) is True
+
+
+# Setters of the slots of Hex, which are faster than calling object.__setattr__ with the slot names
+_set_hex_uppercase = Hex.uppercase.__set__
+_set_hex_include_hash = Hex.include_hash.__set__
+_set_hex_include_a = Hex.include_a.__set__
+_set_hex_tail_a = Hex.tail_a.__set__
+_set_hex_lazy_rgba = Hex._lazy_rgba.__set__
+_set_hex_rgba_u32 = Hex._rgba_u32.__set__
+
+
+@functools.lru_cache(maxsize=_HEX_CACHE_SIZE, typed=True)
+def _cached_hex(cls, hex_str, uppercase, include_hash, include_a, tail_a):
+    return cls._parse(hex_str, uppercase, include_hash, include_a, tail_a)
+
+
+# Colors of the same class and parameters share the same ColorFormat object for internal use
+@functools.lru_cache(maxsize=256)
+def _cached_format(color_sys, *params):
+    return colorir.color_format.ColorFormat(color_sys, **dict(zip(color_sys._format_params, params)))
+
+
+def _rgba_array(rgba):
+    """Returns `rgba` as a read-only array of 8-bit unsigned integers.
+
+    Since the arrays are never modified, an array that is already read-only (such as the '._rgba' of
+    another color) is shared rather than copied.
+    """
+    if isinstance(rgba, tuple):
+        # Rounding the four components in Python is faster than np.rint for tuples
+        r, g, b, a = rgba
+        rgba = np.array((round(r), round(g), round(b), round(a)), dtype=np.uint8)
+    elif isinstance(rgba, np.ndarray) and not rgba.flags.writeable and rgba.dtype == np.uint8:
+        return rgba
+    else:
+        rgba = np.rint(rgba).astype(np.uint8)
+    rgba.flags.writeable = False
+    return rgba
+
+
+def _pack_rgba(rgba):
+    """Packs an array of 8-bit RGBA values into a single integer (R << 24 | G << 16 | B << 8 | A)."""
+    r, g, b, a = rgba.tolist()
+    return r << 24 | g << 16 | b << 8 | a
+
+
+# Colors built from the same arguments are shared, like Hex objects, since they are immutable. Only
+# the most recently used ones are kept (see '_cached_tuple_color')
+_TUPLE_CACHE_SIZE = 4096
+
+
+# Types are part of the key so that e.g. RGB(1, 0, 0) and RGB(1.0, 0, 0) are not shared
+@functools.lru_cache(maxsize=_TUPLE_CACHE_SIZE, typed=True)
+def _cached_tuple_color(cls, *args):
+    return cls._create(*args)
+
+
+def _elementwise(foo, vals1, vals2):
+    """Applies `foo` to each pair of components of two sequences, stopping at the shortest one."""
+    # Colors have three or four components, so these cases are unrolled to avoid the map overhead
+    if isinstance(vals2, (tuple, list)):
+        n = min(len(vals1), len(vals2))
+        if n == 3:
+            return foo(vals1[0], vals2[0]), foo(vals1[1], vals2[1]), foo(vals1[2], vals2[2])
+        if n == 4:
+            return (foo(vals1[0], vals2[0]), foo(vals1[1], vals2[1]), foo(vals1[2], vals2[2]),
+                    foo(vals1[3], vals2[3]))
+    return tuple(map(foo, vals1, vals2))
 
 
 # Aliases
@@ -158,6 +158,9 @@ class ColorFormat:
     def _from_rgba(self, rgba):
         return self.color_sys._from_rgba(rgba, **self.format_params)
 
+    def _from_rgba_array(self, rgba):
+        return self.color_sys._from_rgba_array(rgba, **self.format_params)
+
     def format(self, color: "color_class.ColorLike") -> "color_class.ColorBase":
         """Tries to format a color-like object into this color format.
 
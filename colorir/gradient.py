@@ -43,10 +43,12 @@ Examples:
 import numpy as np
 from copy import copy, deepcopy
 from typing import Iterable, Type, List
-from . import config, utils
+from . import config
 from .color_class import RGB, CIELuv, ColorBase, HCLuv, ColorPolarBase, Hex, ColorLike
 from .color_format import MATPLOTLIB_COLOR_FORMAT
 
+import colorir
+
 __all__ = [
     "Grad",
     "PolarGrad",
@@ -120,7 +122,7 @@ class Grad:
     def __repr__(self):
         if config.REPR_STYLE in ["traditional", "inherit"]:
             return str(self)
-        return utils.swatch(self, file=None)
+        return colorir.utils.swatch(self, file=None)
 
     def __call__(self, x, restrict_domain=False):
         return self.at(x, restrict_domain=restrict_domain)
@@ -327,15 +329,17 @@ class RGBGrad(Grad):
         self.use_linear_rgb = use_linear_rgb
 
     def _linear_interp(self, color1, color2, p: float) -> ColorBase:
-        rgba_1 = color1._rgba
-        rgba_2 = color2._rgba
         if self.use_linear_rgb:
-            rgba_1 = utils._to_linear_rgb(rgba_1 / 255)
-            rgba_2 = utils._to_linear_rgb(rgba_2 / 255)
+            rgba_1 = colorir.utils._to_linear_rgb_8bit(color1._rgba)
+            rgba_2 = colorir.utils._to_linear_rgb_8bit(color2._rgba)
+        else:
+            # '._rgba' holds unsigned 8-bit integers, which would wrap around when subtracted
+            rgba_1 = color1._rgba.astype(float)
+            rgba_2 = color2._rgba.astype(float)
 
         new_rgba = rgba_1 + (rgba_2 - rgba_1) * p
         if self.use_linear_rgb:
-            new_rgba = utils._to_srgb(new_rgba) * 255
+            new_rgba = colorir.utils._to_srgb(new_rgba) * 255
         return RGB._from_rgba(new_rgba)
 
 
@@ -56,6 +56,7 @@ from typing import Union, List, Dict, Iterable, Type
 from warnings import warn
 from . import config
 from . import utils
+from ._dist_numba import nearest_simplified
 from .color_class import ColorBase, RGB, HSL, HSV, ColorLike
 from .color_format import ColorFormat
 from .gradient import Grad
@@ -256,12 +257,10 @@ class Palette(PaletteBase):
             palettes = list(found_palettes)
         # Reiterates based on user input order
         for palette_name in palettes:
-            for c_name, c_rgba in found_palettes[palette_name].items():
-                c_rgba = np.array([int(c_rgba[3:5], 16),
-                                   int(c_rgba[5:7], 16),
-                                   int(c_rgba[7:9], 16),
-                                   int(c_rgba[1:3], 16)])
-                new_color = palette_obj.color_format._from_rgba(c_rgba)
+            c_dict = found_palettes[palette_name]
+            # Colors of each file are decoded and converted to the palette's format all at once
+            new_colors = palette_obj.color_format._from_rgba_array(_decode_hex_rgba(c_dict.values()))
+            for c_name, new_color in zip(c_dict, new_colors):
                 old_color = palette_obj.get_color(c_name, None)
                 if old_color is None:
                     palette_obj.add(c_name, new_color)
@@ -514,8 +513,17 @@ class Palette(PaletteBase):
         Returns:
             A tuple (color_name, color) if `n` == 1 or a `Palette` if `n` != 1.
         """
-        closest = sorted(zip(self.color_names, self.colors),
-                         key=lambda tup: utils.color_dist(color, tup[1], method))
+        if method == "simplified" and n == 1:
+            colors = self.colors
+            i = nearest_simplified(utils._as_rgba_array([color]), utils._as_rgba_array(colors))[0]
+            return self.color_names[i], colors[i]
+        if method == "simplified":
+            dists = utils.simplified_dist_batch([color], self.colors)[0]
+            items = list(zip(self.color_names, self.colors))
+            closest = [items[i] for i in np.argsort(dists, kind="stable")]
+        else:
+            closest = sorted(zip(self.color_names, self.colors),
+                             key=lambda tup: utils.color_dist(color, tup[1], method))
         if n == 1:
             return closest[0]
         if n < 1:
@@ -634,12 +642,8 @@ class StackPalette(PaletteBase):
             palettes = list(found_palettes)
         # Reiterates based on user input order
         for palette_name in palettes:
-            for c_rgba in found_palettes[palette_name]:
-                c_rgba = np.array([int(c_rgba[3:5], 16),
-                                   int(c_rgba[5:7], 16),
-                                   int(c_rgba[7:9], 16),
-                                   int(c_rgba[1:3], 16)])
-                new_color = palette_obj.color_format._from_rgba(c_rgba)
+            c_rgbas = _decode_hex_rgba(found_palettes[palette_name])
+            for new_color in palette_obj.color_format._from_rgba_array(c_rgbas):
                 palette_obj.add(new_color)
         return palette_obj
 
@@ -947,8 +951,16 @@ class StackPalette(PaletteBase):
             A single color object if `n` == 1 or a `StackPalette` if `n` != 1.
         """
         color = self.color_format.format(color)
-        closest = sorted(self.colors,
-                         key=lambda color2: utils.color_dist(color, color2, method=method))
+        if method == "simplified" and n == 1:
+            colors = self.colors
+            return colors[nearest_simplified(utils._as_rgba_array([color]), utils._as_rgba_array(colors))[0]]
+        if method == "simplified":
+            colors = self.colors
+            dists = utils.simplified_dist_batch([color], colors)[0]
+            closest = [colors[i] for i in np.argsort(dists, kind="stable")]
+        else:
+            closest = sorted(self.colors,
+                             key=lambda color2: utils.color_dist(color, color2, method=method))
         if n == 1:
             return closest[0]
         pal = StackPalette(color_format=self.color_format)
@@ -1032,6 +1044,13 @@ def delete_palette(palette: str, palettes_dir: str = None):
         raise ValueError(f"palette name '{palette}' is ambiguous (more than one palette share it)")
 
 
+def _decode_hex_rgba(hex_strs) -> np.ndarray:
+    """Decodes the '#aarrggbb' strings stored in palette files into an (N, 4) array of RGBA values."""
+    values = np.array([int(hex_str[1:], 16) for hex_str in hex_strs], dtype=np.int64)
+    return np.stack([values >> 16 & 0xff, values >> 8 & 0xff, values & 0xff, values >> 24 & 0xff],
+                    axis=1)
+
+
 def _resolve_palettes_dirs(palettes_dir, search_builtins, search_cwd):
     if palettes_dir is None:
         palettes_dir = config.DEFAULT_PALETTES_DIR
@@ -2,15 +2,15 @@ import os
 import sys
 import numpy as np
 from math import sqrt
-from random import randint
+from random import randrange
 from typing import List, Iterable, get_args
 
 from . import config
 from . import palette
-from .colormath.color_conversions import convert_color
-from .colormath.color_diff import *
-from .colormath.color_objects import sRGBColor, LabColor
+from . import _cie
 from .color_class import ColorBase, HCLab, ColorLike
+from .color_array import ColorArray
+from ._dist_numba import pairwise_simplified
 from .color_format import ColorFormat
 from .gradient import Grad
 
@@ -21,8 +21,10 @@ __all__ = [
     "swatch",
     "show",
     "simplified_dist",
+    "simplified_dist_batch",
     "color_dist",
     "random_color",
+    "random_colors",
     "color_str",
     "hue_sort_key",
     "hue_sorted",
@@ -296,25 +298,69 @@ def simplified_dist(color1: ColorLike,
             https://www.compuphase.com/cmetric.htm.
 
     Args:
-        color1: First color point.
-        color2: Second color point.
+        color1: First color point. May also be an array of shape (N, 4) with RGBA values in the
+            range 0-255, in which case the distances are computed element-wise and returned as an
+            array (see :func:`simplified_dist_batch` to compare all pairs of colors instead).
+        color2: Second color point. May also be an array of shape (N, 4), as `color1`.
     """
+    if isinstance(color1, np.ndarray) or isinstance(color2, np.ndarray):
+        rgba1 = np.asarray(color1, dtype=float)
+        rgba2 = np.asarray(color2, dtype=float)
+        return _simplified_dist_rgb(rgba1[..., 0], rgba1[..., 1], rgba1[..., 2],
+                                    rgba2[..., 0], rgba2[..., 1], rgba2[..., 2],
+                                    sqrt=np.sqrt)
+
     color_format = config.DEFAULT_COLOR_FORMAT
     # We only need the '._rgba's, so no need to convert if already ColorBase
     if not isinstance(color1, ColorBase):
         color1 = color_format.format(color1)
     if not isinstance(color2, ColorBase):
         color2 = color_format.format(color2)
-    rgba1, rgba2 = color1._rgba, color2._rgba
-    avg_r = (rgba1[0] + rgba2[0]) / (2 * 255)
-    d_r = rgba1[0] - rgba2[0]
-    d_g = rgba1[1] - rgba2[1]
-    d_b = rgba1[2] - rgba2[2]
+    r1, g1, b1, _ = color1._rgba.tolist()
+    r2, g2, b2, _ = color2._rgba.tolist()
+    return _simplified_dist_rgb(r1, g1, b1, r2, g2, b2)
+
+
+def _simplified_dist_rgb(r1, g1, b1, r2, g2, b2, sqrt=sqrt):
+    """Distance formula of 'simplified_dist'.
+
+    Works both for scalars and for NumPy arrays (in which case `sqrt` must be ``np.sqrt``).
+    """
+    avg_r = (r1 + r2) / (2 * 255)
+    d_r = r1 - r2
+    d_g = g1 - g2
+    d_b = b1 - b2
     return sqrt((2 + avg_r) * d_r ** 2
                 + 4 * d_g ** 2
                 + (3 - avg_r) * d_b ** 2)
 
 
+def simplified_dist_batch(colors1, colors2, dtype=np.float64) -> np.ndarray:
+    """Calculates the :func:`simplified_dist` between every pair of colors of two sequences at once.
+
+    This is the vectorized counterpart of :func:`simplified_dist` and should be preferred when
+    comparing many colors, e.g. when matching colors against a palette.
+
+    Examples:
+        >>> simplified_dist_batch(["#ffffff", "#000000"], ["#000000"])
+        array([[765.],
+               [  0.]])
+
+    Args:
+        colors1: Sequence of N color-like objects, a :class:`~colorir.color_array.ColorArray` or an
+            array of shape (N, 3) or (N, 4) with RGB(A) values in the range 0-255.
+        colors2: Sequence of M color-like objects, a :class:`~colorir.color_array.ColorArray` or an
+            array of shape (M, 3) or (M, 4) with RGB(A) values in the range 0-255.
+        dtype: Floating point type used for the calculations. Passing ``np.float32`` halves the
+            memory used by large distance matrices at the cost of some precision.
+
+    Returns:
+        An array of shape (N, M) where the element (i, j) is the distance between the i-th color of
+        `colors1` and the j-th color of `colors2`.
+    """
+    return pairwise_simplified(_as_rgba_array(colors1, dtype), _as_rgba_array(colors2, dtype), dtype)
+
+
 # TODO doc (mention 2000 not working properly in colormath and kwargs for delta-e funcs)
 def color_dist(color1: ColorLike, color2: ColorLike, method="CIE76"):
     if method == "simplified":
@@ -325,10 +371,12 @@ def color_dist(color1: ColorLike, color2: ColorLike, method="CIE76"):
         color1 = color_format.format(color1)
     if not isinstance(color2, ColorBase):
         color2 = color_format.format(color2)
-    color1 = sRGBColor(*color1._rgba[:3], is_upscaled=True)
-    color2 = sRGBColor(*color2._rgba[:3], is_upscaled=True)
-    color1 = convert_color(color1, LabColor, target_illuminant="d65")
-    color2 = convert_color(color2, LabColor, target_illuminant="d65")
+    # colormath is only imported here since it is slow to import and only needed for the delta E
+    # formulas (the conversions to CIELab are done by colorir itself)
+    from .colormath.color_diff import delta_e_cie1976, delta_e_cie1994, delta_e_cie2000, delta_e_cmc
+    from .colormath.color_objects import LabColor
+    color1 = LabColor(*_cie.srgb8_to_lab(*color1._rgba[:3].tolist()), illuminant="d65")
+    color2 = LabColor(*_cie.srgb8_to_lab(*color2._rgba[:3].tolist()), illuminant="d65")
 
     if method == "CIE76":
         return delta_e_cie1976(color1, color2)
@@ -357,16 +405,47 @@ def random_color(random_a=False,
     """
     if color_format is None:
         color_format = config.DEFAULT_COLOR_FORMAT
+    # randrange(256) draws the same numbers as randint(0, 255) with less call overhead
     if random_a:
-        a = randint(0, 255)
+        a = randrange(256)
     else:
         a = 255
-    return color_format._from_rgba((randint(0, 255),
-                                    randint(0, 255),
-                                    randint(0, 255),
+    return color_format._from_rgba((randrange(256),
+                                    randrange(256),
+                                    randrange(256),
                                     a))
 
 
+def random_colors(n: int,
+                  random_a=False,
+                  color_format: ColorFormat = None) -> List[ColorBase]:
+    """Generates many random colors at once.
+
+    This is much faster than calling :func:`random_color` repeatedly, since all components are
+    drawn in a single call to NumPy's random number generator.
+
+    Args:
+        n: Number of colors to generate.
+        random_a: Whether to randomize the alpha attribute as well or just make it 1.
+        color_format: Specifies the format of the output colors. Defaults to
+            :data:`config.DEFAULT_COLOR_FORMAT <colorir.config.DEFAULT_COLOR_FORMAT>`.
+
+    Examples:
+        >>> random_colors(2)  # doctest: +SKIP
+        [Hex('#304fcc'), Hex('#a1e310')]
+
+        To keep the colors in compact form, use :class:`~colorir.color_array.ColorArray` instead:
+
+        >>> ColorArray.from_rgba(np.random.randint(0, 256, (10000, 4)))  # doctest: +SKIP
+    """
+    if color_format is None:
+        color_format = config.DEFAULT_COLOR_FORMAT
+    rgba = np.random.randint(0, 256, (n, 4))
+    if not random_a:
+        rgba[:, 3] = 255
+    return color_format._from_rgba_array(rgba)
+
+
 def color_str(string: str,
               fg_color: ColorLike = None,
               bg_color: ColorLike = None) -> str:
@@ -392,16 +471,45 @@ def color_str(string: str,
     return string
 
 
+def _as_rgba_array(colors, dtype=np.float64):
+    """Stacks the '._rgba's of `colors` into an array of shape (N, 4).
+
+    Arrays are passed through as they are, so they may also be of shape (N, 3).
+    """
+    if isinstance(colors, np.ndarray):
+        if colors.ndim != 2 or colors.shape[1] not in (3, 4):
+            raise ValueError("'colors' must be an array of shape (N, 3) or (N, 4)")
+        return colors.astype(dtype, copy=False)
+    if isinstance(colors, ColorArray):
+        return colors.rgba.astype(dtype)
+    color_format = config.DEFAULT_COLOR_FORMAT
+    return np.array([(color if isinstance(color, ColorBase) else color_format.format(color))._rgba
+                     for color in colors], dtype=dtype).reshape(-1, 4)
+
+
 # https://entropymine.com/imageworsener/srgbformula/
 def _to_linear_rgb(rgba):
-    """rgba must be in range 0-1"""
-    srgb = np.array(rgba[:-1])
+    """rgba must be in range 0-1, can also be an array of shape (N, 4)"""
+    rgba = np.asarray(rgba)
+    srgb = rgba[..., :-1]
     lrgb = np.where(srgb <= 0.04045, srgb / 12.92, ((srgb + 0.055) / 1.055) ** 2.4)
-    return np.pad(lrgb, [(0, 1)], constant_values=rgba[-1])
+    return np.concatenate([lrgb, rgba[..., -1:]], axis=-1)
+
+
+def _to_linear_rgb_8bit(rgba):
+    """rgba must hold integers in range 0-255, can also be an array of shape (N, 4). Returns values
+    in range 0-1"""
+    rgba = np.asarray(rgba)
+    return np.concatenate([_SRGB_TO_LINEAR[rgba[..., :-1]], rgba[..., -1:] / 255], axis=-1)
 
 
 def _to_srgb(rgba):
-    """rgba must be in range 0-1"""
-    lrgb = np.array(rgba[:-1])
+    """rgba must be in range 0-1, can also be an array of shape (N, 4)"""
+    rgba = np.asarray(rgba)
+    lrgb = rgba[..., :-1]
     srgb = np.where(lrgb <= 0.0031308, lrgb * 12.92, 1.055 * lrgb ** (1 / 2.4) - 0.055)
-    return np.pad(srgb, [(0, 1)], constant_values=rgba[-1])
\ No newline at end of file
+    return np.concatenate([srgb, rgba[..., -1:]], axis=-1)
+
+
+# The table of linear values of _cie as an array, so that it can index whole arrays of colors
+_SRGB_TO_LINEAR = np.array(_cie.SRGB8_TO_LINEAR)
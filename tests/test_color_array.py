@@ -0,0 +1,78 @@
+import doctest
+import unittest
+import numpy as np
+from colorir import *
+
+config.REPR_STYLE = "traditional"
+
+
+class TestColorArray(unittest.TestCase):
+    def setUp(self):
+        self.colors = [Hex("#ff0000"), Hex("#12345678", include_a=True), Hex("#ffffff")]
+
+    def test_roundtrip(self):
+        arr = ColorArray.from_colors(self.colors)
+        self.assertEqual(arr.r.dtype, np.uint8)
+        self.assertEqual(arr.to_colors(), self.colors)
+        self.assertEqual(list(arr), self.colors)
+        self.assertEqual(arr[1], self.colors[1])
+        self.assertEqual(arr[1:].to_colors(), self.colors[1:])
+
+    def test_to_colors_format(self):
+        arr = ColorArray.from_colors(self.colors)
+        c_format = ColorFormat(HSL, round_to=2)
+        self.assertEqual(arr.to_colors(c_format), [c_format.format(c) for c in self.colors])
+
+    def test_from_rgba(self):
+        arr = ColorArray.from_rgba([[255, 0, 0, 255], [0, 0, 0, 0]])
+        np.testing.assert_array_equal(arr.rgba, [[255, 0, 0, 255], [0, 0, 0, 0]])
+        self.assertEqual(len(ColorArray(5)), 5)
+        arr = ColorArray.from_rgba([[255, 0, 0], [0, 0, 127.6]])
+        np.testing.assert_array_equal(arr.rgba, [[255, 0, 0, 255], [0, 0, 128, 255]])
+        for rgba in ([[300, -1, 0, 255]], [255, 0, 0], [[255, 0]]):
+            with self.assertRaises(ValueError):
+                ColorArray.from_rgba(rgba)
+
+    def test_from_cie(self):
+        rng = np.random.default_rng(0)
+        h, c, l = rng.uniform(0, 360, 200), rng.uniform(0, 130, 200), rng.uniform(0, 100, 200)
+        a = rng.random(200)
+        arr = ColorArray.from_hclab(h, c, l, a)
+        self.assertEqual(arr.to_colors(), [HCLab(*specs) for specs in zip(h, c, l, a)])
+        arr = ColorArray.from_cielab(l, c - 65, 65 - c, max_a=100)
+        self.assertEqual(arr.to_colors(),
+                         [CIELab(l_, a_, b, max_a=100) for l_, a_, b in zip(l, c - 65, 65 - c)])
+        arr = ColorArray.from_hcluv(h, c, l, a)
+        self.assertEqual(arr.to_colors(), [HCLuv(*specs) for specs in zip(h, c, l, a)])
+        l, u, v = np.append(l, 0), np.append(c - 65, 10), np.append(65 - c, 10)
+        arr = ColorArray.from_cieluv(l, u, v)
+        self.assertEqual(arr.to_colors(), [CIELuv(*specs) for specs in zip(l, u, v)])
+        with self.assertRaises(ValueError):
+            ColorArray.from_cielab([101], [0], [0])
+
+    def test_from_hue_based(self):
+        rng = np.random.default_rng(0)
+        h, s, l = rng.uniform(0, 720, 200), rng.random(200), rng.random(200)
+        a = rng.random(200)
+        arr = ColorArray.from_hsl(h, s, l, a)
+        self.assertEqual(arr.to_colors(), [HSL(*specs) for specs in zip(h, s, l, a)])
+        h, s, v = h / 360, s * 100, l * 100
+        arr = ColorArray.from_hsv(h, s, v, max_h=1, max_sva=100)
+        self.assertEqual(arr.to_colors(), [HSV(*specs, max_h=1, max_sva=100) for specs in zip(h, s, v)])
+        with self.assertRaises(ValueError):
+            ColorArray.from_hsv([0], [1.5], [0])
+
+    def test_hsv(self):
+        arr = ColorArray.from_colors(self.colors)
+        for color, h, s, v in zip(self.colors, *arr.hsv()):
+            hsv = color.hsv(max_h=1, round_to=-1)
+            np.testing.assert_allclose((h, s, v), hsv)
+
+
+def load_tests(loader, tests, ignore):
+    tests.addTests(doctest.DocTestSuite(color_array))
+    return tests
+
+
+if __name__ == "__main__":
+    unittest.main()
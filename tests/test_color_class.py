@@ -1,5 +1,9 @@
+import colorsys
+import copy
 import doctest
+import pickle
 import unittest
+from unittest import mock
 import numpy as np
 
 from colorir import *
@@ -25,6 +29,8 @@ class TestConversion(unittest.TestCase):
             color,
             (50, 78, 5)
         )
+        self.assertEqual(RGB._from_rgba(tuple(self.rgba)), color)
+        self.assertEqual(CMY._from_rgba(tuple(self.rgba)), CMY._from_rgba(self.rgba))
 
     def test_hsl_conversion(self):
         color = HSL(0.23059, 0.87950, 0.16275, max_h=1)
@@ -66,6 +72,7 @@ class TestConversion(unittest.TestCase):
             CMYK._from_rgba(self.rgba),
             (0.35897, 0, 0.9359, 0.69412)
         )
+        self.assertEqual(CMYK._from_rgba(tuple(self.rgba)), color)
 
     def test_cielab_conversion(self):
         color = CIELab(29.757, -22.344, 35.474)
@@ -123,5 +130,238 @@ class TestConversion(unittest.TestCase):
         )
 
 
+class TestEquality(unittest.TestCase):
+    def test_hash_consistency(self):
+        colors = [Hex("#324e05"), Hex("#324E05", uppercase=True), RGB(50, 78, 5, max_rgb=255),
+                  HSL._from_rgba(np.array([50, 78, 5, 255]))]
+        for color in colors[1:]:
+            self.assertEqual(colors[0], color)
+            self.assertEqual(hash(colors[0]), hash(color))
+        self.assertEqual(len(set(colors)), 1)
+        self.assertNotEqual(Hex("#324e05"), Hex("#324e06"))
+
+
+class TestCache(unittest.TestCase):
+    def test_tuple_cache(self):
+        for color_sys in (RGB, HSL, HSV):
+            self.assertIs(color_sys(0, 0, 0), color_sys(0, 0, 0))
+            self.assertIsNot(color_sys(0, 0, 0), color_sys(0, 0, 0, include_a=True))
+            self.assertEqual(str(color_sys(1.0, 0, 0)), "(1.0, 0, 0)")
+            self.assertEqual(str(color_sys(1, 0, 0)), "(1, 0, 0)")
+        self.assertEqual(RGB(np.float64(0.5), 0, 0), RGB(0.5, 0, 0))
+
+    def test_tuple_cache_eviction(self):
+        for i in range(5000):
+            HSL(i % 360, 0.5, i / 5000)
+        self.assertIs(HSL(1, 0, 0), HSL(1, 0, 0))
+
+    def test_immutable(self):
+        color = RGB(0, 0, 0)
+        with self.assertRaises(AttributeError):
+            color.tag = "black"
+        with self.assertRaises(AttributeError):
+            color.max_rgb = 255
+        with self.assertRaises(AttributeError):
+            del color.a
+        self.assertNotIn("tag", vars(RGB(0, 0, 0)))
+        self.assertEqual(RGB(0, 0, 0).max_rgb, 1)
+        # Colors that are not cached are immutable too, so that all color classes behave the same
+        for color in (CMYK(0, 0, 0, 1), CIELab(50, 0, 0), HCLuv(0, 0, 50), HSV(0, 0, 0).hsl()):
+            with self.assertRaisesRegex(AttributeError, "objects are immutable"):
+                color.round_to = 2
+
+
+class TestFormatParams(unittest.TestCase):
+    def test_format_not_shared(self):
+        color_format = HSL(0, 0.5, 0.5).format
+        color_format.format_params["max_h"] = 1
+        color_format.color_sys = RGB
+        self.assertEqual(HSL(0, 0.5, 0.5).format.format_params["max_h"], 360)
+        self.assertIs(HSL(0, 0.5, 0.5).format.color_sys, HSL)
+        self.assertEqual(HSL(0, 0.5, 0.5) + HSL(120, 0, 0), HSL(120, 0.5, 0.5))
+
+    def test_class_defaults(self):
+        color = HSL(0, 0.5, 0.5)
+        self.assertNotIn("max_h", vars(color))
+        self.assertEqual(color.format.format_params,
+                         {"include_a": False, "round_to": -1, "max_h": 360, "max_sla": 1})
+        color = HSL._from_rgba(np.array([50, 78, 5, 255]), max_sla=100, include_a=True)
+        self.assertEqual(color.max_sla, 100)
+        self.assertTrue(color.include_a)
+        self.assertEqual(color.format.format_params,
+                         {"include_a": True, "round_to": -1, "max_h": 360, "max_sla": 100})
+
+    def test_from_array_params(self):
+        for color_sys, params in ((RGB, {"max_rgb": 255, "linear": True}), (CMYK, {"max_cmyka": 100}),
+                                  (HCLab, {"max_h": 1, "round_to": 2})):
+            colors = color_sys.from_array([[50, 78, 5, 255], [0, 0, 0, 128]], **params)
+            for color in colors:
+                self.assertEqual(color, color_sys._from_rgba(color._rgba, **params))
+                self.assertEqual({name: vars(color)[name] for name in params}, params)
+                self.assertNotIn("include_a", vars(color))
+
+
+class TestArithmetic(unittest.TestCase):
+    def test_same_format(self):
+        color = HSV(120, 0.5, 0.5) + HSV(60, 0.25, 0.25)
+        self.assertIsInstance(color, HSV)
+        self.assertEqual(tuple(color), (180, 0.75, 0.75))
+
+    def test_different_format(self):
+        color = Hex("#000000") + CIELab(50, 0, 0)
+        self.assertIsInstance(color, Hex)
+        self.assertEqual(color, CIELab(50, 0, 0))
+
+
+class TestHex(unittest.TestCase):
+    def test_slots(self):
+        # Nonempty __slots__ are only rejected for tuple subclasses, not for str subclasses like Hex
+        self.assertFalse(hasattr(Hex("#abcdef"), "__dict__"))
+        self.assertTrue(hasattr(RGB(0, 0, 0), "__dict__"))
+
+    def test_immutable(self):
+        color = Hex("00ff00")
+        with self.assertRaises(AttributeError):
+            color.uppercase = True
+        with self.assertRaises(AttributeError):
+            del color.include_hash
+        self.assertFalse(Hex("00ff00").uppercase)
+        self.assertEqual(str(Hex("00ff00")), "#00ff00")
+
+    def test_copy_pickle(self):
+        color = Hex("ABCDEF80", uppercase=True, include_hash=False, include_a=True, tail_a=True)
+        for new_color in (copy.copy(color), copy.deepcopy(color), pickle.loads(pickle.dumps(color))):
+            self.assertEqual(str(new_color), "ABCDEF80")
+            self.assertEqual(new_color.format.format_params, color.format.format_params)
+            self.assertEqual(new_color._rgba.tolist(), [171, 205, 239, 128])
+
+    def test_cache(self):
+        self.assertIs(Hex("#abcdef"), Hex("#abcdef"))
+        self.assertIsNot(Hex("#abcdef"), Hex("#abcdef", uppercase=True))
+        with self.assertWarns(FutureWarning):
+            Hex("#abcdef", include_a=True)
+        with self.assertWarns(FutureWarning):
+            Hex("#abcdef", include_a=True)
+
+    def test_cache_key(self):
+        # Hex arguments must be cached by their string rather than their RGBA values
+        tail = Hex("#ff000080", include_a=True, tail_a=True)
+        head = Hex("#80ff0000", include_a=True, tail_a=False)
+        self.assertEqual(str(Hex(tail, include_a=True, tail_a=True)), "#ff000080")
+        self.assertEqual(str(Hex(head, include_a=True, tail_a=True)), "#80ff0000")
+
+    def test_cache_eviction(self):
+        for i in range(5000):
+            Hex(f"#{i:06x}")
+        self.assertIs(Hex("#abcdef"), Hex("#abcdef"))
+
+    def test_same_format_conversion(self):
+        color = Hex("#abcdef")
+        self.assertIs(color.hex(), color)
+        self.assertEqual(color.hex(uppercase=True), "#ABCDEF")
+        color = Hex("#abcdef12", include_a=True, tail_a=True)
+        self.assertIs(color.hex(include_a=True, tail_a=True), color)
+        self.assertEqual(color.hex(), "#abcdef")
+
+    def test_from_rgba_array(self):
+        rgba = np.concatenate([np.random.default_rng(0).integers(0, 256, (100, 4)), [[0, 0, 0, 0]]])
+        for kwargs in ({}, {"uppercase": True, "include_a": True, "tail_a": True},
+                       {"include_hash": False, "include_a": True, "tail_a": False}):
+            expected = [Hex._from_rgba(row, **kwargs) for row in rgba]
+            for color, expected_color in zip(Hex._from_rgba_array(rgba, **kwargs), expected):
+                self.assertEqual(str(color), str(expected_color))
+                self.assertEqual(color.format.format_params, expected_color.format.format_params)
+                self.assertEqual(color, expected_color)
+
+    def test_invalid(self):
+        for hex_str in ("#ab", "#abcdeg", "ab cd ef", "0x1234", "+12345", "12_345"):
+            with self.assertRaises(ValueError):
+                Hex(hex_str)
+
+
+class TestVectorizedColorsys(unittest.TestCase):
+    def test_matches_colorsys(self):
+        from colorir import _colorsys
+        rng = np.random.default_rng(0)
+        specs = np.concatenate([rng.random((3, 200)), np.array([[0, 1, 0.5, 1, 0.2], [0, 1, 0.5, 0, 0.2],
+                                                                [0, 1, 0.5, 0, 0.4]])], axis=1)
+        for name in ("rgb_to_hls", "hls_to_rgb", "rgb_to_hsv", "hsv_to_rgb"):
+            expected = np.array([getattr(colorsys, name)(*col) for col in specs.T]).T
+            result = np.array(getattr(_colorsys, name + "_array")(*specs))
+            np.testing.assert_array_equal(result, expected)
+
+    def test_from_rgba_array(self):
+        rng = np.random.default_rng(0)
+        rgba = np.concatenate([rng.integers(0, 256, (200, 4)),
+                               [[0, 0, 0, 0], [128, 128, 128, 255], [255, 255, 255, 0]]])
+        for c_format in (ColorFormat(HSL), ColorFormat(HSL, max_h=1, max_sla=100, round_to=2),
+                         ColorFormat(HSV), ColorFormat(HSV, max_h=1, max_sva=100, round_to=2),
+                         ColorFormat(RGB), ColorFormat(RGB, max_rgb=255, linear=True, round_to=3),
+                         ColorFormat(CMYK), ColorFormat(CMYK, max_cmyka=100, round_to=1),
+                         ColorFormat(CMY), ColorFormat(CMY, max_cmya=255, round_to=0)):
+            expected = [c_format._from_rgba(row) for row in rgba]
+            for color, expected_color in zip(c_format._from_rgba_array(rgba), expected):
+                self.assertEqual(tuple(color), tuple(expected_color))
+                self.assertEqual(color.a, expected_color.a)
+                self.assertEqual(color, expected_color)
+                # Components must be Python numbers rather than NumPy scalars
+                self.assertEqual({type(val) for val in (*color, color.a)} - {int, float}, set())
+
+    def test_from_array(self):
+        self.assertEqual(Hex.from_array([[255, 0, 0], [0, 0, 255]]), ["#ff0000", "#0000ff"])
+        self.assertEqual(RGB.from_array([[255, 0, 0, 0]], include_a=True), [(1, 0, 0, 0)])
+        self.assertEqual(HSL.from_array(np.empty((0, 4))), [])
+        with self.assertRaises(ValueError):
+            RGB.from_array([255, 0, 0])
+        with self.assertRaises(ValueError):
+            RGB.from_array([[300, -1, 0]])
+        for color in RGB.from_array([[255, 0, 0, 128]], max_rgb=255) + RGB.from_array([[0, 0, 255]], linear=True):
+            self.assertEqual({type(val) for val in (*color, color.a)}, {float})
+
+
+class TestCIEConversions(unittest.TestCase):
+    def test_matches_colormath(self):
+        from colorir import _cie
+        from colorir.colormath.color_conversions import convert_color
+        from colorir.colormath.color_objects import sRGBColor, LabColor, LuvColor
+        rng = np.random.default_rng(0)
+        for rgb in np.concatenate([rng.integers(0, 256, (100, 3)), [[0, 0, 0], [255, 255, 255]]]):
+            for color_sys, to_cie, from_cie in ((LabColor, _cie.srgb_to_lab, _cie.lab_to_srgb),
+                                                (LuvColor, _cie.srgb_to_luv, _cie.luv_to_srgb)):
+                expected = convert_color(sRGBColor(*rgb, is_upscaled=True), color_sys,
+                                         target_illuminant="d65")
+                cie = to_cie(*rgb / 255)
+                np.testing.assert_allclose(cie, expected.get_value_tuple(), atol=1e-9)
+                expected = convert_color(expected, sRGBColor)
+                np.testing.assert_allclose(from_cie(*cie), [expected.clamped_rgb_r,
+                                                            expected.clamped_rgb_g,
+                                                            expected.clamped_rgb_b], atol=1e-9)
+
+    def test_8bit_cache(self):
+        from colorir import _cie
+        for rgb in ((0, 0, 0), (18, 52, 86), (255, 255, 255)):
+            for _ in range(2):
+                self.assertEqual(_cie.srgb8_to_lab(*rgb), _cie.srgb_to_lab(*np.array(rgb) / 255))
+                self.assertEqual(_cie.srgb8_to_luv(*rgb), _cie.srgb_to_luv(*np.array(rgb) / 255))
+
+    def test_from_rgba_array(self):
+        rng = np.random.default_rng(0)
+        rgba = rng.integers(0, 256, (200, 4))
+        gray_rgba = np.concatenate([rgba, [[0, 0, 0, 0], [255, 255, 255, 255]]])
+        # The hue of grays is ill-defined, so it is only compared for the cartesian color systems
+        for c_format, c_rgba in ((ColorFormat(CIELab), gray_rgba),
+                                 (ColorFormat(CIELuv, max_a=100, include_a=True), gray_rgba),
+                                 (ColorFormat(HCLab), rgba),
+                                 (ColorFormat(HCLuv, max_h=1), rgba)):
+            # Both the kernel and the per-color path must be taken
+            for rows in (c_rgba, c_rgba[:10]):
+                expected = [c_format._from_rgba(row) for row in rows]
+                with mock.patch.object(color_class, "_CIE_KERNEL_MIN_SIZE", 64):
+                    colors = c_format._from_rgba_array(rows)
+                for color, expected_color in zip(colors, expected):
+                    np.testing.assert_allclose(color, expected_color, rtol=1e-12, atol=1e-12)
+                    self.assertEqual(color, expected_color)
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,21 @@
+import importlib
+import unittest
+
+import colorir
+
+
+class TestLazyImports(unittest.TestCase):
+    def test_all_names_available(self):
+        for module_name, names in colorir._lazy_names.items():
+            module = importlib.import_module("colorir." + module_name)
+            self.assertEqual(sorted(names), sorted(module.__all__))
+            for name in names:
+                self.assertIs(getattr(colorir, name), getattr(module, name))
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            colorir.not_a_name
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,8 +3,14 @@ import unittest
 from pathlib import Path
 from random import randint
 import re
+import subprocess
+import sys
+from unittest import mock
+
+import numpy as np
 
 from colorir import *
+from colorir import _dist_numba
 
 config.REPR_STYLE = "traditional"
 config.DEFAULT_PALETTES_DIR = str(Path(__file__).resolve().parent / "test_palettes")
@@ -32,11 +38,50 @@ class TestPalette(unittest.TestCase):
         with self.assertWarns(Warning):
             Palette.load(palettes=["test1", "test2"], search_builtins=False)
 
+    def test_load_skips_numba(self):
+        # Importing numba costs much more than converting a palette to a CIE format color by color
+        code = ("import sys, warnings; warnings.simplefilter('ignore'); from colorir import *; "
+                "[Palette.load(color_format=ColorFormat(color_sys)) "
+                "for color_sys in (CIELab, CIELuv, HCLab, HCLuv)]; "
+                "print('numba' in sys.modules)")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=Path(__file__).resolve().parents[1])
+        self.assertEqual(result.stdout.strip(), "False")
+
     def test_color_manipulation(self):
         pal = Palette(red="ff0000", green="00ff00", blue="0000ff")
         manip_dict = {"red": HCLuv(1, 0.5, 1), "green": CIELab(0.2, 1, 1), "blue": HSL(0.5, 1, 1)}
         self.assertEqual(pal * manip_dict, Palette(red="#d05959", green="#003d00", blue="#00ff00"))
 
+    def test_most_similar_simplified(self):
+        pal = Palette({f"c{i}": "%02x%02x%02x" % (randint(0, 255), randint(0, 255), randint(0, 255))
+                       for i in range(50)})
+        color = Hex("#808080")
+        closest = min(pal.colors, key=lambda c: utils.simplified_dist(color, c))
+        self.assertEqual(pal.most_similar(color, method="simplified")[1], closest)
+        self.assertEqual(pal.most_similar(color, n=2, method="simplified").colors[0], closest)
+
+    def test_most_similar_ties(self):
+        # Few distinct values make many exact ties, which must resolve to the first color like sorting did
+        rng = np.random.default_rng(0)
+        for hi in (4, 256):
+            spal = StackPalette(RGB(*rgb, max_rgb=255) for rgb in rng.integers(0, hi, (40, 3)).tolist())
+            for rgb in rng.integers(0, hi, (20, 3)).tolist():
+                color = RGB(*rgb, max_rgb=255)
+                expected = sorted(spal.colors, key=lambda c: utils.simplified_dist(color, c))[0]
+                self.assertIs(spal.most_similar(color, method="simplified"), expected)
+                with mock.patch.object(_dist_numba, "_KERNEL_MIN_SIZE", 0):
+                    self.assertIs(spal.most_similar(color, method="simplified"), expected)
+
+    def test_most_similar_skips_numba(self):
+        code = ("import sys; from colorir import *; "
+                "Palette(red='#ff0000', blue='#0000ff').most_similar('#880000', method='simplified'); "
+                "StackPalette(['#ff0000', '#0000ff']).most_similar('#880000', n=2, method='simplified'); "
+                "print('numba' in sys.modules)")
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=Path(__file__).resolve().parents[1])
+        self.assertEqual(result.stdout.strip(), "False")
+
 
 class TestStackPalette(unittest.TestCase):
     def test_and_op(self):
@@ -1,6 +1,8 @@
 import doctest
 import unittest
+import numpy as np
 from colorir import *
+from colorir import _cie
 
 config.REPR_STYLE = "traditional"
 
@@ -15,6 +17,78 @@ class TestDistance(unittest.TestCase):
         dist = utils.simplified_dist(RGB(1, 1, 1), RGB(0, 0, 0))
         self.assertAlmostEqual(dist, 765)
 
+    def test_simple_dist_batch(self):
+        colors1 = [RGB(1, 1, 1), Hex("#ff8800"), HSL(200, 0.5, 0.3)]
+        colors2 = [RGB(0, 0, 0), Hex("#123456")]
+        dists = utils.simplified_dist_batch(colors1, colors2)
+        self.assertEqual(dists.shape, (3, 2))
+        for i, color1 in enumerate(colors1):
+            for j, color2 in enumerate(colors2):
+                self.assertAlmostEqual(dists[i, j], utils.simplified_dist(color1, color2))
+
+    def test_simple_dist_batch_arrays(self):
+        rgb1 = np.array([[255, 255, 255], [255, 136, 0], [18, 52, 86]])
+        rgb2 = np.array([[0, 0, 0], [18, 52, 86]])
+        dists = utils.simplified_dist_batch(rgb1, rgb2)
+        self.assertEqual(dists.shape, (3, 2))
+        np.testing.assert_allclose(dists, utils.simplified_dist_batch(
+            np.pad(rgb1, ((0, 0), (0, 1)), constant_values=255), rgb2))
+        self.assertAlmostEqual(dists[0, 0], 765)
+        with self.assertRaises(ValueError):
+            utils.simplified_dist_batch(np.zeros((4, 5)), rgb2)
+        with self.assertRaises(ValueError):
+            utils.simplified_dist_batch(np.zeros(12), rgb2)
+
+    def test_nearest_blocks(self):
+        from colorir._dist_numba import nearest_simplified
+        rng = np.random.default_rng(0)
+        queries, palette = rng.integers(0, 256, (300, 3)), rng.integers(0, 256, (500, 3))
+        # 300 x 500 pairs are split into several blocks by the NumPy implementation
+        np.testing.assert_array_equal(nearest_simplified(queries, palette),
+                                      np.argmin(utils.simplified_dist_batch(queries, palette), axis=1))
+
+    def test_simple_dist_arrays(self):
+        rgba1 = np.array([[255, 255, 255, 255], [255, 136, 0, 255]])
+        rgba2 = np.array([[0, 0, 0, 255], [18, 52, 86, 255]])
+        dists = utils.simplified_dist(rgba1, rgba2)
+        self.assertEqual(dists.shape, (2,))
+        for i in range(2):
+            self.assertAlmostEqual(dists[i], utils.simplified_dist(RGB._from_rgba(rgba1[i]),
+                                                                   RGB._from_rgba(rgba2[i])))
+
+    def test_color_dist(self):
+        from colorir.colormath import color_diff
+        from colorir.colormath.color_conversions import convert_color
+        from colorir.colormath.color_objects import sRGBColor, LabColor
+        color1, color2 = Hex("#ff8800"), HSL(200, 0.5, 0.3)
+        labs = [convert_color(sRGBColor(*color._rgba[:3], is_upscaled=True), LabColor,
+                              target_illuminant="d65") for color in (color1, color2)]
+        for method, delta_e in (("CIE76", color_diff.delta_e_cie1976),
+                                ("CIE94", color_diff.delta_e_cie1994),
+                                ("CIE2000", color_diff.delta_e_cie2000),
+                                ("CMC", color_diff.delta_e_cmc)):
+            self.assertAlmostEqual(utils.color_dist(color1, color2, method), delta_e(*labs), places=9)
+
+
+class TestRandom(unittest.TestCase):
+    def test_random_colors(self):
+        colors = utils.random_colors(50, color_format=ColorFormat(RGB, max_rgb=255))
+        self.assertEqual(len(colors), 50)
+        for color in colors:
+            self.assertIsInstance(color, RGB)
+            self.assertEqual(color.a, 1)
+        self.assertEqual(len(utils.random_colors(0)), 0)
+
+
+class TestLinearRGB(unittest.TestCase):
+    def test_lookup_table(self):
+        rgba = np.stack([np.arange(256)] * 4, axis=1)
+        # The table is computed with math.pow, which may differ from NumPy in the last bit
+        np.testing.assert_allclose(utils._to_linear_rgb_8bit(rgba.astype(np.uint8)),
+                                   utils._to_linear_rgb(rgba / 255), rtol=0, atol=1e-15)
+        self.assertEqual(utils._to_linear_rgb_8bit(rgba[255].astype(np.uint8))[:3].tolist(),
+                         [_cie.SRGB8_TO_LINEAR[255]] * 3)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file